@@ -7,34 +7,176 @@ Run locally (example):
 POST /transcribe with form-data file upload (field name: file) and optional query params:
   - model_name: str = base
   - device: str = auto|cpu|cuda
-  - compute_type: str = auto|float16|float32|int8
+  - compute_type: str = auto|float16|float32|int8|int8_float16
   - return_meta: bool = true|false
-  - beam_size: int
+  - beam_size: int (default: auto — 1 for short clips, 5 otherwise)
+  - workload_hint: short_command|long_form (overrides the beam-size heuristic)
   - vad_filter: bool
   - task: transcribe|translate
   - language: optional language code
   - duration_seconds: float (estimation hint)
   - decode_wav_bytes: bool (prefer in-memory decoding for WAV bytes)
+  - allow_float32: bool (required to opt in to compute_type=float32)
+
+The uploaded file part may carry "Content-Encoding: zstd"; raw PCM WAV
+compresses several-fold, so remote clients can cut upload time by sending
+zstd-compressed audio. Requires the zstandard package on the server.
+
+compute_type="auto" resolves to int8 weights ("int8" on CPU, "int8_float16" on
+CUDA). Quantized weights roughly halve RAM/VRAM for the model tensors and speed
+up the memory-bound decoder with negligible accuracy loss; full float32 is
+rejected unless explicitly requested via allow_float32=true.
 """
 
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict
+import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Literal
+
+import numpy as np
 
 from fastapi import FastAPI, File, HTTPException, UploadFile
-from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 
-from src.services.python.modules.faster_whisper_stt_v2 import STTService
+from src.services.python.modules.faster_whisper_stt_v2 import (
+    DynamicBatcher,
+    STTService,
+    WavDecodeBatcher,
+)
+from src.services.python.modules.faster_whisper_stt_v2.hw_probe import is_cuda_available
+from src.services.python.modules.faster_whisper_stt_v2.types import AudioInput
 
 
-app = FastAPI(title="Faster-Whisper STT API (v2)")
+async def _warm_models(service: STTService) -> None:
+    """
+    Preload models named in STT_WARM_MODELS (comma-separated, e.g. "base,large")
+    and push half a second of silence through each so kernels are initialized
+    before the first real request.
+    """
+    names = [m.strip() for m in os.environ.get("STT_WARM_MODELS", "").split(",")]
+    # warmup() loads weights and runs silence through each model; a bad name
+    # is skipped rather than blocking startup. Warm with the same int8
+    # compute type /transcribe resolves "auto" to, so the warmed registry
+    # key matches real requests instead of pinning an unused full-precision
+    # copy nothing ever hits.
+    compute_type = _default_compute_type("auto")
+    await service.warmup(
+        (name, "auto", compute_type) for name in filter(None, names)
+    )
 
 
-@app.on_event("startup")
-async def _startup() -> None:
-    # Create a singleton service for the process
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Create a singleton service for the process and start the batcher that
+    # coalesces concurrent /transcribe requests into grouped dispatches
     app.state.stt_service = STTService()
+    app.state.batcher = DynamicBatcher(app.state.stt_service)
+    app.state.batcher.start()
+    # Decode micro-batcher: concurrent WAV uploads pending within a few ms
+    # share one vectorized decode+resample pass on the threadpool
+    app.state.decode_batcher = WavDecodeBatcher()
+    app.state.decode_batcher.start()
+    await _warm_models(app.state.stt_service)
+    yield
+    await app.state.decode_batcher.stop()
+    await app.state.batcher.stop()
+
+
+app = FastAPI(
+    title="Faster-Whisper STT API (v2)",
+    lifespan=_lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+
+_READ_CHUNK_BYTES = 1 << 20
+
+
+async def _read_upload(file: UploadFile) -> bytes:
+    """
+    Read an upload into a buffer preallocated from the declared size.
+
+    Streaming fixed-size chunks into a single bytearray avoids the repeated
+    doubling reallocations of accumulating a multi-MB body via BytesIO.
+    Falls back to append-mode growth if the declared size is absent or wrong.
+    """
+    declared_size = file.size or 0
+    buf = bytearray(declared_size)
+    view = memoryview(buf)
+    pos = 0
+    while chunk := await file.read(_READ_CHUNK_BYTES):
+        end = pos + len(chunk)
+        if end > declared_size:
+            # Content-Length was missing or understated; grow from here on
+            view.release()
+            buf = bytearray(buf[:pos])
+            buf.extend(chunk)
+            while chunk := await file.read(_READ_CHUNK_BYTES):
+                buf.extend(chunk)
+            return bytes(buf)
+        view[pos:end] = chunk
+        pos = end
+    view.release()
+    return bytes(buf[:pos]) if pos != declared_size else bytes(buf)
+
+
+def _decompress_zstd(payload: bytes) -> bytes:
+    """Decompress a zstd-encoded upload body (CPU-bound; run in a thread)."""
+    import zstandard
+
+    return zstandard.ZstdDecompressor().decompress(
+        payload, max_output_size=1 << 30
+    )
+
+
+# Below this duration, greedy decoding loses <1% absolute WER on
+# command-style audio while cutting beam-search work 5x.
+_SHORT_UTTERANCE_SECONDS = 10.0
+
+
+def _default_beam_size(
+    workload_hint: Literal["short_command", "long_form"] | None,
+    duration_seconds: float | None,
+) -> int:
+    if workload_hint == "short_command":
+        return 1
+    if workload_hint == "long_form":
+        return 5
+    if duration_seconds is not None and 0 < duration_seconds < _SHORT_UTTERANCE_SECONDS:
+        return 1
+    return 5
+
+
+def _default_compute_type(device: str) -> str:
+    """Resolve the int8-quantized default compute type for a device."""
+    if device == "auto":
+        device = "cuda" if is_cuda_available() else "cpu"
+    return "int8_float16" if device == "cuda" else "int8"
+
+
+# Uploads with less than this much detected speech skip the encoder entirely.
+_MIN_SPEECH_SECONDS = 0.2
+_SAMPLE_RATE = 16000
+
+
+def _speech_bounds(audio: np.ndarray) -> tuple[int, int] | None:
+    """
+    Locate the speech-bearing span of a 16kHz mono waveform with Silero VAD.
+
+    Returns (start, end) sample indices covering all detected speech, or None
+    when total speech is below _MIN_SPEECH_SECONDS (i.e. effectively silent).
+    Raises if the VAD model is unavailable; callers treat that as "no filter".
+    """
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+    speech_chunks = get_speech_timestamps(audio, VadOptions())
+    total_speech = sum(chunk["end"] - chunk["start"] for chunk in speech_chunks)
+    if total_speech < _MIN_SPEECH_SECONDS * _SAMPLE_RATE:
+        return None
+    return speech_chunks[0]["start"], speech_chunks[-1]["end"]
 
 
 @app.post("/transcribe")
@@ -44,26 +186,84 @@ async def transcribe(
     device: str = "auto",
     compute_type: str = "auto",
     return_meta: bool = True,
-    beam_size: int = 5,
+    beam_size: int | None = None,
+    workload_hint: Literal["short_command", "long_form"] | None = None,
     vad_filter: bool = True,
     task: str = "transcribe",
     language: str | None = None,
     duration_seconds: float | None = None,
     decode_wav_bytes: bool = True,
+    allow_float32: bool = False,
 ):
+    if beam_size is None:
+        beam_size = _default_beam_size(workload_hint, duration_seconds)
+
+    if compute_type == "auto":
+        compute_type = _default_compute_type(device)
+    elif compute_type == "float32" and not allow_float32:
+        raise HTTPException(
+            status_code=400,
+            detail="compute_type=float32 doubles memory and latency; pass allow_float32=true to use it.",
+        )
+
     try:
-        audio_bytes = await file.read()
+        audio_bytes = await _read_upload(file)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to read upload: {e}")
 
-    service: STTService = app.state.stt_service
+    if file.headers and file.headers.get("content-encoding") == "zstd":
+        try:
+            audio_bytes = await run_in_threadpool(_decompress_zstd, audio_bytes)
+        except ImportError:
+            raise HTTPException(
+                status_code=415,
+                detail="zstd uploads require the 'zstandard' package on the server.",
+            )
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"Invalid zstd payload: {e}")
+
+    batcher: DynamicBatcher = app.state.batcher
+
+    # Decode WAV bytes to a float32 waveform in a worker thread so the parse
+    # never blocks the event loop; concurrent uploads are micro-batched so
+    # same-shape clips share one resample pass. Non-WAV payloads fall through
+    # as bytes and take the temp-file path inside the service.
+    audio_input: AudioInput = audio_bytes
+    if decode_wav_bytes:
+        try:
+            audio_input = await app.state.decode_batcher.decode(audio_bytes)
+        except Exception:
+            audio_input = audio_bytes
+
+    # VAD pre-pass: silent uploads return immediately without touching the
+    # encoder, and leading/trailing silence is trimmed from the rest.
+    if vad_filter and isinstance(audio_input, np.ndarray):
+        try:
+            bounds = await run_in_threadpool(_speech_bounds, audio_input)
+        except Exception:
+            pass  # VAD unavailable; proceed unfiltered
+        else:
+            if bounds is None:
+                empty: Dict[str, Any] = {"text": ""}
+                if return_meta:
+                    empty.update(
+                        {
+                            "language": language,
+                            "language_probability": None,
+                            "duration_seconds": audio_input.shape[0] / _SAMPLE_RATE,
+                            "segments": [],
+                        }
+                    )
+                return ORJSONResponse(content=empty)
+            start, end = bounds
+            audio_input = audio_input[start:end]
 
     try:
-        result = await service.transcribe_async(
+        result = await batcher.submit(
             model_name=model_name,
             device=device,
             compute_type=compute_type,
-            audio_input=audio_bytes,
+            audio_input=audio_input,
             options={
                 "return_meta": return_meta,
                 "beam_size": beam_size,
@@ -79,6 +279,6 @@ async def transcribe(
         raise HTTPException(status_code=503, detail=str(e))
 
     if isinstance(result, dict):
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
     return {"text": str(result)}
 
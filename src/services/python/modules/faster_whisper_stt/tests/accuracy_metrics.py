@@ -4,9 +4,25 @@ Accuracy metrics for transcription evaluation.
 Provides utilities to calculate Word Error Rate (WER), Character Error Rate (CER),
 and other accuracy metrics for comparing transcriptions.
 """
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
+import os
 import re
 
+import numpy as np
+
+try:
+    from rapidfuzz.distance import Levenshtein as _RFLevenshtein
+except ImportError:  # pragma: no cover - exercised only without rapidfuzz
+    _RFLevenshtein = None
+
+# Set ACCURACY_METRICS_PURE_PYTHON=1 to force the pure-Python fallback
+# (useful for debugging or environments without rapidfuzz wheels).
+_USE_PURE_PYTHON = os.environ.get("ACCURACY_METRICS_PURE_PYTHON") == "1"
+
+# Precompiled at module scope so normalize_text skips the re-cache lookup
+_PUNCT_RE = re.compile(r'[^\w\s]', flags=re.UNICODE)
+_WS_RE = re.compile(r'\s+')
+
 
 def normalize_text(text: str) -> str:
     """
@@ -21,47 +37,100 @@ def normalize_text(text: str) -> str:
     Returns:
         Normalized text
     """
-    # Convert to lowercase
-    text = text.lower()
+    return _WS_RE.sub(' ', _PUNCT_RE.sub('', text.lower())).strip()
 
-    # Remove punctuation (keep only alphanumeric and spaces)
-    text = re.sub(r'[^\w\s]', '', text)
 
-    # Normalize whitespace
-    text = ' '.join(text.split())
+def levenshtein_distance(s1: Sequence, s2: Sequence) -> int:
+    """
+    Calculate the Levenshtein distance between two sequences.
 
-    return text
+    Uses rapidfuzz's C++ bit-parallel implementation when available
+    (50-200x faster than the Python loop); falls back to the pure-Python
+    dynamic-programming version otherwise.
 
+    Args:
+        s1: First sequence (string or list of words)
+        s2: Second sequence (string or list of words)
 
-def levenshtein_distance(s1: str, s2: str) -> int:
+    Returns:
+        Minimum number of single-element edits required
     """
-    Calculate the Levenshtein distance between two strings.
+    if s1 == s2:
+        return 0
+    if _RFLevenshtein is not None and not _USE_PURE_PYTHON:
+        # rapidfuzz trims common affixes internally; no Python-side pre-pass
+        return _RFLevenshtein.distance(s1, s2)
+    return _py_levenshtein(*_strip_common_affixes(s1, s2))
 
-    Args:
-        s1: First string
-        s2: Second string
 
-    Returns:
-        Minimum number of single-character edits required
+def _strip_common_affixes(s1: Sequence, s2: Sequence) -> Tuple[Sequence, Sequence]:
+    """
+    Drop the shared prefix and suffix of two sequences.
+
+    Edits can only occur in the divergent middle, so the DP fallback runs on
+    a much smaller problem for near-matching transcripts (the common case in
+    high-accuracy tests).
+    """
+    n1, n2 = len(s1), len(s2)
+    limit = min(n1, n2)
+    prefix = 0
+    while prefix < limit and s1[prefix] == s2[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and s1[n1 - 1 - suffix] == s2[n2 - 1 - suffix]:
+        suffix += 1
+    return s1[prefix:n1 - suffix], s2[prefix:n2 - suffix]
+
+
+def _encode_sequences(s1: Sequence, s2: Sequence) -> Tuple[List[int], np.ndarray]:
+    """Map sequence elements to integer codes so rows compare vectorized."""
+    if isinstance(s1, str) and isinstance(s2, str):
+        return [ord(c) for c in s1], np.fromiter(
+            (ord(c) for c in s2), dtype=np.int64, count=len(s2)
+        )
+    # Word lists (or other hashables): assign ids via a shared vocabulary
+    vocab: dict = {}
+    codes1 = [vocab.setdefault(e, len(vocab)) for e in s1]
+    codes2 = np.fromiter(
+        (vocab.setdefault(e, len(vocab)) for e in s2), dtype=np.int64, count=len(s2)
+    )
+    return codes1, codes2
+
+
+def _py_levenshtein(s1: Sequence, s2: Sequence) -> int:
+    """
+    NumPy row-sweep Wagner-Fischer fallback for levenshtein_distance.
+
+    The insertion/substitution candidates are computed as whole-row numpy
+    expressions; the data-dependent deletion recurrence
+    ``cur[j] = min(cand[j], cur[j-1] + 1)`` is resolved as a prefix-min over
+    ``cand[j] - j`` (subtracting the column index turns the +1-per-step chain
+    into a plain running minimum).
     """
     if len(s1) < len(s2):
-        return levenshtein_distance(s2, s1)
+        return _py_levenshtein(s2, s1)
 
     if len(s2) == 0:
         return len(s1)
 
-    previous_row = range(len(s2) + 1)
-    for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            # Cost of insertions, deletions, or substitutions
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
-        previous_row = current_row
+    codes1, codes2 = _encode_sequences(s1, s2)
+
+    n2 = len(s2)
+    col_idx = np.arange(n2 + 1, dtype=np.int32)
+    previous_row = col_idx.copy()
+    current_row = np.empty(n2 + 1, dtype=np.int32)
+    for i, c1 in enumerate(codes1):
+        substitutions = previous_row[:-1] + (codes2 != c1)
+        insertions = previous_row[1:] + 1
+        current_row[0] = i + 1
+        np.minimum(substitutions, insertions, out=current_row[1:])
+        # Deletion chain as prefix-min in index-shifted space
+        current_row -= col_idx
+        np.minimum.accumulate(current_row, out=current_row)
+        current_row += col_idx
+        previous_row, current_row = current_row, previous_row
 
-    return previous_row[-1]
+    return int(previous_row[-1])
 
 
 def word_error_rate(reference: str, hypothesis: str, normalize: bool = True) -> float:
@@ -139,6 +208,23 @@ def accuracy_score(reference: str, hypothesis: str, normalize: bool = True) -> f
     return max(0.0, 100.0 - wer)
 
 
+def get_diff_summary_prenormalized(normalized_reference: str, hypothesis: str) -> dict:
+    """
+    Variant of get_diff_summary for references normalized ahead of time
+    (e.g. once per TestData definition instead of once per test run).
+
+    Args:
+        normalized_reference: Ground truth already passed through normalize_text
+        hypothesis: The raw transcription from the model
+
+    Returns:
+        Dictionary with accuracy metrics and comparison details
+    """
+    return get_diff_summary(
+        normalized_reference, normalize_text(hypothesis), normalize=False
+    )
+
+
 def get_diff_summary(reference: str, hypothesis: str, normalize: bool = True) -> dict:
     """
     Get a detailed summary of differences between reference and hypothesis.
@@ -151,9 +237,6 @@ def get_diff_summary(reference: str, hypothesis: str, normalize: bool = True) ->
     Returns:
         Dictionary with accuracy metrics and comparison details
     """
-    original_ref = reference
-    original_hyp = hypothesis
-
     if normalize:
         reference = normalize_text(reference)
         hypothesis = normalize_text(hypothesis)
@@ -161,9 +244,19 @@ def get_diff_summary(reference: str, hypothesis: str, normalize: bool = True) ->
     ref_words = reference.split()
     hyp_words = hypothesis.split()
 
-    wer = word_error_rate(original_ref, original_hyp, normalize)
-    cer = character_error_rate(original_ref, original_hyp, normalize)
-    acc = accuracy_score(original_ref, original_hyp, normalize)
+    # One word-level and one character-level Levenshtein run suffice;
+    # WER, CER and accuracy are all derived from those two distances.
+    if len(ref_words) == 0:
+        wer = 100.0 if len(hyp_words) > 0 else 0.0
+    else:
+        wer = (levenshtein_distance(ref_words, hyp_words) / len(ref_words)) * 100
+
+    if len(reference) == 0:
+        cer = 100.0 if len(hypothesis) > 0 else 0.0
+    else:
+        cer = (levenshtein_distance(reference, hypothesis) / len(reference)) * 100
+
+    acc = max(0.0, 100.0 - wer)
 
     return {
         "wer": round(wer, 2),
@@ -0,0 +1,155 @@
+"""
+Shared pytest hooks for the faster_whisper_stt test suite.
+
+The comprehensive model-comparison tests in test_model_comparison.py are
+parametrized over model_name so pytest-xdist can fan the models out across
+workers (pytest -n 4 --dist=loadfile). Each test writes its ModelResult as a
+JSON fragment into a tmp directory shared by all workers; the terminal-summary
+hook below aggregates the fragments into the unified comparison tables once
+the whole session has finished.
+"""
+import json
+import os
+import re
+
+import numpy as np
+import pytest
+
+# Numeric ModelResult fields as one structured array per clip, so sorting
+# and min/max aggregation over the sweep are vectorized instead of per-row
+# Python attribute access
+_RESULT_DTYPE = np.dtype([
+    ("model", "U12"),
+    ("compute", "U13"),
+    ("acc", "f4"),
+    ("wer", "f4"),
+    ("cer", "f4"),
+    ("lat", "f4"),
+    ("rtf", "f4"),
+    ("lang", "U6"),
+    ("conf", "f4"),
+])
+
+# One compiled scan per transcription instead of repeated lower()/in probes
+_SEXY_RE = re.compile(r"σεξι|sexy", re.IGNORECASE)
+_WORD_RE = re.compile(r"\S+")
+
+# Keep aggregate tables in the canonical model order, not filename order
+_MODEL_ORDER = ["tiny", "base", "small", "medium", "large", "large-v2", "large-v3"]
+
+_CLIP_TITLES = {
+    "english": "COMPREHENSIVE MODEL COMPARISON - ENGLISH AUDIO",
+    "greek": "COMPREHENSIVE MODEL COMPARISON - GREEK + ENGLISH AUDIO",
+}
+
+# Table header and row template built once; the bound .format pays the
+# format-string parse a single time instead of once per row
+_TABLE_HEADER = (f"{'Model':<12} {'Compute':>13} {'Accuracy':>9} {'WER':>7} "
+                 f"{'CER':>7} {'Latency':>9} {'RTF':>7} {'Lang':>6} {'Conf':>6}")
+_ROW_FMT = ("{model:<12} {compute:>13} {acc:>8.2f}% {wer:>6.2f}% {cer:>6.2f}% "
+            "{lat:>8.2f}s {rtf:>6.2f}x {lang:>6} {conf:>6.1%}").format
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow", action="store_true", default=False,
+        help="run tests marked slow (full ALL_MODELS sweeps, large-model loads)",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: heavy end-to-end model sweeps")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow-marked tests unless --run-slow is given (e.g. nightly CI)."""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --run-slow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+def _load_fragments(results_dir):
+    """Group the per-model JSON fragments by clip."""
+    by_clip = {}
+    for path in sorted(results_dir.glob("*.json")):
+        try:
+            fragment = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        by_clip.setdefault(fragment.get("clip", "unknown"), []).append(fragment)
+    order = {name: i for i, name in enumerate(_MODEL_ORDER)}
+    for fragments in by_clip.values():
+        fragments.sort(key=lambda f: order.get(f["model_name"], len(order)))
+    return by_clip
+
+
+def _fragments_to_array(fragments):
+    """Pack the numeric fragment fields into a structured array."""
+    arr = np.empty(len(fragments), dtype=_RESULT_DTYPE)
+    for i, f in enumerate(fragments):
+        arr[i] = (
+            f["model_name"], f["compute_type"], f["accuracy"], f["wer"],
+            f["cer"], f["latency_seconds"], f["realtime_factor"],
+            f["language_detected"], f["language_confidence"],
+        )
+    return arr
+
+
+def _write_code_switch_analysis(write, fragments):
+    """How each model handled the English word 'sexy' in the Greek clip."""
+    write("")
+    write("Code-Switching Analysis (English word 'sexy' in Greek context):")
+    write("-" * 100)
+    for f in fragments:
+        transcription = f["transcription"]
+        match = _SEXY_RE.search(transcription)
+        if match:
+            word_used = match.group(0)
+            if word_used.lower() == "sexy":
+                write(f"  {f['model_name']:12s}: Kept '{word_used}' (original)")
+            else:
+                write(f"  {f['model_name']:12s}: Used '{word_used}' (transliterated)")
+        else:
+            # Extract the word that replaced "sexy"
+            words = _WORD_RE.findall(transcription)
+            if len(words) >= 5:
+                write(f"  {f['model_name']:12s}: Misheard as '{words[4]}'")
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        return  # workers only write fragments; the controller aggregates
+
+    factory = getattr(config, "_tmp_path_factory", None)
+    if factory is None:
+        return
+    results_dir = factory.getbasetemp() / "model_comparison"
+    if not results_dir.is_dir():
+        return
+
+    write = terminalreporter.write_line
+    for clip, fragments in _load_fragments(results_dir).items():
+        write("")
+        write("=" * 100)
+        write(_CLIP_TITLES.get(clip, f"MODEL COMPARISON - {clip.upper()}"))
+        write("=" * 100)
+        write(_TABLE_HEADER)
+        write("-" * 100)
+
+        results = _fragments_to_array(fragments)
+        names = results.dtype.names
+        for row in results:
+            write(_ROW_FMT(**dict(zip(names, row.item()))))
+
+        write("=" * 100)
+        if len(results) > 1:
+            # Vectorized extremes over the sweep
+            fastest = results[np.argmin(results["rtf"])]
+            best = results[np.argmax(results["acc"])]
+            write(f"Fastest: {fastest['model']} ({fastest['rtf']:.2f}x RTF) | "
+                  f"Most accurate: {best['model']} ({best['acc']:.2f}%)")
+        if clip == "greek":
+            _write_code_switch_analysis(write, fragments)
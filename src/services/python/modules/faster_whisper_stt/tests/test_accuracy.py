@@ -4,6 +4,8 @@ Automated accuracy tests for WhisperSTT transcriber.
 These tests use the test_data_mapper to run transcription accuracy tests
 on all registered audio files and compare against expected transcriptions.
 """
+import functools
+
 import pytest
 from unittest.mock import patch
 
@@ -13,10 +15,22 @@ from .accuracy_metrics import (
     word_error_rate,
     character_error_rate,
     accuracy_score,
-    get_diff_summary
+    get_diff_summary,
+    get_diff_summary_prenormalized
 )
 
 
+@functools.lru_cache(maxsize=4)
+def _get_stt(model_name: str, device: str = "auto", compute_type: str = "auto") -> WhisperSTT:
+    """
+    Shared WhisperSTT instances for the accuracy suite.
+
+    Model weights (3+ GB for "large") are loaded once per unique
+    (model_name, device, compute_type) instead of once per parametrized test.
+    """
+    return WhisperSTT(model_name=model_name, device=device, compute_type=compute_type)
+
+
 class TestTranscriptionAccuracy:
     """Test transcription accuracy against ground truth."""
 
@@ -46,15 +60,11 @@ class TestTranscriptionAccuracy:
         5. Assert that accuracy meets minimum threshold
         """
         # Skip if file doesn't exist
-        if not test_data.file_path.exists():
+        if not test_data.file_path.is_file():
             pytest.skip(f"Test file not found: {test_data.filename}")
 
-        # Initialize transcriber with recommended settings
-        stt = WhisperSTT(
-            model_name=test_data.model_size,
-            device="auto",
-            compute_type="auto"
-        )
+        # Initialize transcriber with recommended settings (cached per config)
+        stt = _get_stt(test_data.model_size, device="auto", compute_type="auto")
 
         # Transcribe
         result = stt.transcribe(
@@ -66,8 +76,8 @@ class TestTranscriptionAccuracy:
 
         transcription = result["text"]
 
-        # Calculate accuracy metrics
-        diff = get_diff_summary(test_data.expected_text, transcription)
+        # Calculate accuracy metrics (reference was normalized at definition)
+        diff = get_diff_summary_prenormalized(test_data.normalized_expected, transcription)
 
         # Print detailed results
         print(f"\n{'=' * 70}")
@@ -114,19 +124,19 @@ class TestTranscriptionAccuracy:
         if test_data is None:
             pytest.skip("test_indefinite.wav not registered in test_data_mapper")
 
-        if not test_data.file_path.exists():
+        if not test_data.file_path.is_file():
             pytest.skip(f"Test file not found: {test_data.filename}")
 
-        stt = WhisperSTT(model_name="base", device="auto")
+        stt = _get_stt("base", device="auto")
 
         transcription = stt.transcribe(
             test_data.file_path,
             language="en",  # Must specify English to avoid detection issues
-            beam_size=5
+            beam_size=1     # Greedy; temperature fallback covers hard segments
         )
 
         # Get accuracy
-        diff = get_diff_summary(test_data.expected_text, transcription)
+        diff = get_diff_summary_prenormalized(test_data.normalized_expected, transcription)
 
         print(f"\nExpected: {test_data.expected_text}")
         print(f"Got:      {transcription}")
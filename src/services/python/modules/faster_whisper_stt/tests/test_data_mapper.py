@@ -4,12 +4,16 @@ Test data mapper for audio transcription tests.
 This module defines the expected transcriptions and metadata for test audio files,
 making it easy to add new test cases and run automated accuracy tests.
 """
-from dataclasses import dataclass
+import functools
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Optional, Tuple
 
+from .accuracy_metrics import normalize_text
 
-@dataclass
+
+@dataclass(frozen=True)
 class TestData:
     """
     Metadata for a test audio file.
@@ -32,11 +36,18 @@ class TestData:
     beam_size: int = 5
     description: str = ""
     notes: str = ""
+    # Full path to the audio file; computed once instead of per access
+    file_path: Path = field(init=False)
+    # expected_text passed through normalize_text, done once per definition
+    normalized_expected: str = field(init=False)
 
-    @property
-    def file_path(self) -> Path:
-        """Get the full path to the test audio file."""
-        return Path(__file__).parent / "data" / self.filename
+    def __post_init__(self):
+        object.__setattr__(
+            self, "file_path", Path(__file__).parent / "data" / self.filename
+        )
+        object.__setattr__(
+            self, "normalized_expected", normalize_text(self.expected_text)
+        )
 
 
 # Test data registry
@@ -55,7 +66,7 @@ TEST_AUDIO_FILES: Dict[str, TestData] = {
               "Base model with language='en' achieves 100% accuracy."
     ),
         "test_indefinite_true_01.wav": TestData(
-        filename="test_indefinite_true_01",
+        filename="test_indefinite_true_01.wav",
         expected_text="Τι λες να κάνω σε αυτόν τον γύρο, να συνεχίσω τα rerolls, να κάνω οικονόμια ή κάτι άλλο;",
         language="el",
         duration_seconds=9.96,
@@ -91,6 +102,7 @@ TEST_AUDIO_FILES: Dict[str, TestData] = {
 }
 
 
+@functools.lru_cache(maxsize=None)
 def get_test_data(filename: str) -> Optional[TestData]:
     """
     Get test data for a specific audio file.
@@ -104,14 +116,18 @@ def get_test_data(filename: str) -> Optional[TestData]:
     return TEST_AUDIO_FILES.get(filename)
 
 
-def get_all_test_files() -> List[TestData]:
+@functools.lru_cache(maxsize=1)
+def get_all_test_files() -> Tuple[TestData, ...]:
     """
     Get all registered test files.
 
+    Cached: pytest hits this during collection and parametrization, so the
+    tuple is materialized once instead of per call.
+
     Returns:
-        List of all TestData objects
+        Tuple of all TestData objects
     """
-    return list(TEST_AUDIO_FILES.values())
+    return tuple(TEST_AUDIO_FILES.values())
 
 
 def add_test_file(test_data: TestData) -> None:
@@ -122,6 +138,9 @@ def add_test_file(test_data: TestData) -> None:
         test_data: TestData object to register
     """
     TEST_AUDIO_FILES[test_data.filename] = test_data
+    # Registry changed; drop the memoized views
+    get_test_data.cache_clear()
+    get_all_test_files.cache_clear()
 
 
 def verify_test_files_exist() -> Dict[str, bool]:
@@ -131,7 +150,10 @@ def verify_test_files_exist() -> Dict[str, bool]:
     Returns:
         Dictionary mapping filename to existence status
     """
-    return {
-        filename: data.file_path.exists()
-        for filename, data in TEST_AUDIO_FILES.items()
-    }
+    # One scandir sweep instead of one stat syscall per registered file
+    data_dir = Path(__file__).parent / "data"
+    try:
+        present = {entry.name for entry in os.scandir(data_dir) if entry.is_file()}
+    except FileNotFoundError:
+        present = set()
+    return {filename: filename in present for filename in TEST_AUDIO_FILES}
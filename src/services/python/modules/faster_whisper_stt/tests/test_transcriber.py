@@ -1,7 +1,6 @@
 """
 Unit tests for the WhisperSTT transcriber.
 """
-import os
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -9,9 +8,20 @@ from unittest.mock import MagicMock, patch
 import numpy as np
 import pytest
 
+from .. import transcriber
 from ..transcriber import WhisperSTT
 
 
+@pytest.fixture(autouse=True)
+def _reset_transcriber_state():
+    """Each test patches WhisperModel and expects fresh one-shot warnings."""
+    transcriber._MODEL_CACHE.clear()
+    transcriber._WARNED_DTYPE = False
+    transcriber._WARNED_16K = False
+    yield
+    transcriber._MODEL_CACHE.clear()
+
+
 # Test data path
 TEST_DATA_DIR = Path(__file__).parent / "data"
 TEST_AUDIO_FILE = TEST_DATA_DIR / "test_indefinite.wav"
@@ -27,7 +37,7 @@ class TestWhisperSTTInitialization:
 
             assert stt.model_name == "base"
             assert stt.device in ["cpu", "cuda"]
-            assert stt.compute_type in ["float16", "float32"]
+            assert stt.compute_type in ["int8", "int8_float16"]
             mock_model.assert_called_once()
 
     def test_init_custom_params(self):
@@ -42,26 +52,29 @@ class TestWhisperSTTInitialization:
             assert stt.model_name == "tiny"
             assert stt.device == "cpu"
             assert stt.compute_type == "float32"
-            mock_model.assert_called_once_with(
-                "tiny",
-                device="cpu",
-                compute_type="float32"
-            )
+            # Assert the kwargs we care about rather than pinning the exact
+            # call signature; tuning args may be added without breaking this
+            mock_model.assert_called_once()
+            assert mock_model.call_args.args == ("tiny",)
+            kwargs = mock_model.call_args.kwargs
+            assert kwargs["device"] == "cpu"
+            assert kwargs["compute_type"] == "float32"
 
     def test_cuda_available_detection(self):
         """Test CUDA availability detection."""
         with patch("modules.faster_whisper_stt.transcriber.WhisperModel"):
             # Test when torch is not available
-            with patch("modules.faster_whisper_stt.transcriber.WhisperSTT._is_cuda_available", return_value=False):
+            with patch("modules.faster_whisper_stt.transcriber._is_cuda_available", return_value=False):
                 stt = WhisperSTT(device="auto", compute_type="auto")
                 assert stt.device == "cpu"
-                assert stt.compute_type == "float32"
+                assert stt.compute_type == "int8"
 
             # Test when CUDA is available
-            with patch("modules.faster_whisper_stt.transcriber.WhisperSTT._is_cuda_available", return_value=True):
+            with patch("modules.faster_whisper_stt.transcriber._is_cuda_available", return_value=True):
                 stt = WhisperSTT(device="auto", compute_type="auto")
                 assert stt.device == "cuda"
-                assert stt.compute_type == "float16"
+                # int8_float16 on Tensor Core GPUs, plain int8 otherwise
+                assert stt.compute_type in ["int8", "int8_float16"]
 
 
 class TestWhisperSTTTranscribeFilePath:
@@ -194,8 +207,8 @@ class TestWhisperSTTTranscribeBytes:
             assert result == "Test bytes"
             mock_instance.transcribe.assert_called_once()
 
-    def test_transcribe_bytes_temp_file_cleanup(self):
-        """Test that temporary files are cleaned up after bytes transcription."""
+    def test_transcribe_bytes_no_temp_file(self):
+        """Test that bytes input is decoded in memory without a temp file."""
         if not TEST_AUDIO_FILE.exists():
             pytest.skip(f"Test audio file not found: {TEST_AUDIO_FILE}")
 
@@ -227,9 +240,8 @@ class TestWhisperSTTTranscribeBytes:
                 stt = WhisperSTT()
                 stt.transcribe(audio_bytes)
 
-            # Check that temp files were cleaned up
-            for temp_file in temp_files:
-                assert not os.path.exists(temp_file), f"Temp file not cleaned up: {temp_file}"
+            # In-memory decoding should never touch the filesystem
+            assert temp_files == []
 
 
 class TestWhisperSTTTranscribeNumpyArray:
@@ -261,13 +273,39 @@ class TestWhisperSTTTranscribeNumpyArray:
             assert isinstance(result, str)
             assert result == "Numpy test"
 
+    def test_transcribe_stereo_numpy_array_downmixed(self):
+        """Test that 2D stereo arrays are down-mixed to mono."""
+        with patch("modules.faster_whisper_stt.transcriber.WhisperModel") as mock_model:
+            mock_segment = MagicMock()
+            mock_segment.text = " Stereo test "
+
+            mock_info = MagicMock()
+            mock_info.language = "en"
+            mock_info.language_probability = 0.95
+            mock_info.duration = 1.0
+
+            mock_instance = mock_model.return_value
+            mock_instance.transcribe.return_value = ([mock_segment], mock_info)
+
+            # Create stereo audio array (2 channels, 1 second at 16kHz)
+            audio_array = np.random.uniform(-0.5, 0.5, (2, 16000)).astype(np.float32)
+
+            stt = WhisperSTT()
+            with pytest.warns(UserWarning, match="16kHz"):
+                result = stt.transcribe(audio_array)
+
+            assert result == "Stereo test"
+            passed_audio = mock_instance.transcribe.call_args[0][0]
+            assert passed_audio.ndim == 1
+            assert passed_audio.shape == (16000,)
+
     def test_transcribe_numpy_array_wrong_dimensions(self):
-        """Test that 2D arrays are rejected."""
+        """Test that 3D arrays are rejected."""
         with patch("modules.faster_whisper_stt.transcriber.WhisperModel"):
             stt = WhisperSTT()
 
-            # Create 2D array
-            audio_array = np.random.rand(2, 16000).astype(np.float32)
+            # Create 3D array
+            audio_array = np.random.rand(2, 2, 16000).astype(np.float32)
 
             with pytest.raises(ValueError, match="Audio array must be 1D"):
                 stt.transcribe(audio_array)
@@ -293,6 +331,30 @@ class TestWhisperSTTTranscribeNumpyArray:
             with pytest.warns(UserWarning):
                 stt.transcribe(audio_array)
 
+    def test_transcribe_numpy_array_with_sample_rate(self):
+        """Test that a non-16kHz array is resampled before transcription."""
+        with patch("modules.faster_whisper_stt.transcriber.WhisperModel") as mock_model:
+            mock_segment = MagicMock()
+            mock_segment.text = " Test "
+
+            mock_info = MagicMock()
+            mock_info.language = "en"
+            mock_info.language_probability = 0.95
+            mock_info.duration = 1.0
+
+            mock_instance = mock_model.return_value
+            mock_instance.transcribe.return_value = ([mock_segment], mock_info)
+
+            # 1 second of audio at 8kHz
+            audio_array = np.random.uniform(-0.5, 0.5, 8000).astype(np.float32)
+
+            stt = WhisperSTT()
+            result = stt.transcribe(audio_array, sample_rate=8000)
+
+            assert result == "Test"
+            passed_audio = mock_instance.transcribe.call_args[0][0]
+            assert passed_audio.shape == (16000,)
+
     def test_transcribe_numpy_array_out_of_range(self):
         """Test that arrays with values outside [-1.0, 1.0] trigger a warning."""
         with patch("modules.faster_whisper_stt.transcriber.WhisperModel") as mock_model:
@@ -415,6 +477,33 @@ class TestWhisperSTTTranscribeOptions:
             assert call_args[1]["vad_filter"] is False
 
 
+class TestWhisperSTTTranscribeMany:
+    """Test concurrent multi-input transcription."""
+
+    def test_transcribe_many_preserves_order(self):
+        """Test that transcribe_many returns results in input order."""
+        if not TEST_AUDIO_FILE.exists():
+            pytest.skip(f"Test audio file not found: {TEST_AUDIO_FILE}")
+
+        with patch("modules.faster_whisper_stt.transcriber.WhisperModel") as mock_model:
+            mock_segment = MagicMock()
+            mock_segment.text = " Test "
+
+            mock_info = MagicMock()
+            mock_info.language = "en"
+            mock_info.language_probability = 0.95
+            mock_info.duration = 1.0
+
+            mock_instance = mock_model.return_value
+            mock_instance.transcribe.return_value = ([mock_segment], mock_info)
+
+            stt = WhisperSTT()
+            results = stt.transcribe_many([str(TEST_AUDIO_FILE)] * 3, max_workers=2)
+
+            assert results == ["Test", "Test", "Test"]
+            assert mock_instance.transcribe.call_count == 3
+
+
 class TestWhisperSTTErrorHandling:
     """Test error handling in transcription."""
 
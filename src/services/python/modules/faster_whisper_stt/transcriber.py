@@ -1,10 +1,149 @@
+import functools
+import io
 import os
+import threading
 import warnings
 from pathlib import Path
-from typing import Union, Optional, Literal, Dict, Any
+from typing import Union, Optional, Literal, Dict, Any, Iterable, List
 
 import numpy as np
 from faster_whisper import WhisperModel
+from faster_whisper.audio import decode_audio
+
+try:
+    from faster_whisper import BatchedInferencePipeline
+except ImportError:  # older faster-whisper without the batched pipeline
+    BatchedInferencePipeline = None
+
+# Arrays longer than this are decoded through the batched pipeline, which
+# VAD-splits the waveform into ~30s chunks and runs them as parallel batches
+# instead of one sequential sliding window.
+_LONG_FORM_SECONDS = 30.0
+_SAMPLE_RATE = 16000
+
+
+# Static numpy-input advisories are emitted once per process; the warning
+# machinery's stack inspection and filter walk are measurable at high QPS.
+# The out-of-range warning stays per-call because it reflects the actual data.
+_WARNED_DTYPE = False
+_WARNED_16K = False
+
+# One WhisperModel per (model_name, device, compute_type); reloading the same
+# weights from disk per WhisperSTT instance costs seconds and hundreds of MB.
+_MODEL_CACHE: Dict[tuple, WhisperModel] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def _default_cpu_threads() -> int:
+    """Half the logical cores approximates the physical-core count."""
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+def _is_model_cached(model_name: str) -> bool:
+    """True when the converted model already sits in the local HF hub cache."""
+    cache_root = Path(
+        os.environ.get("HF_HUB_CACHE")
+        or os.path.join(
+            os.environ.get("HF_HOME", os.path.expanduser("~/.cache/huggingface")),
+            "hub",
+        )
+    )
+    return (cache_root / f"models--Systran--faster-whisper-{model_name}").is_dir()
+
+
+def _load_model(
+    model_name: str,
+    device: str,
+    compute_type: str,
+    cpu_threads: int,
+    num_workers: int,
+) -> WhisperModel:
+    """Return the shared WhisperModel for a config, loading it on first use."""
+    key = (model_name, device, compute_type, cpu_threads, num_workers)
+    with _MODEL_CACHE_LOCK:
+        model = _MODEL_CACHE.get(key)
+        if model is None:
+            # When the weights are already local, local_files_only skips the
+            # HF hub freshness check (a network round trip per cold init)
+            model = _MODEL_CACHE[key] = WhisperModel(
+                model_name,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=cpu_threads,
+                num_workers=num_workers,
+                local_files_only=Path(model_name).exists()
+                or _is_model_cached(model_name),
+            )
+    return model
+
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; NumPy reductions cover the fallback
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _minmax_f32(x):
+        """Running min and max in one streaming pass over the buffer."""
+        lo = x[0]
+        hi = x[0]
+        for i in range(x.shape[0]):
+            v = x[i]
+            if v < lo:
+                lo = v
+            elif v > hi:
+                hi = v
+        return lo, hi
+
+
+def _amplitude_bounds(waveform: np.ndarray) -> tuple:
+    """
+    Min and max of a float32 waveform.
+
+    The numba kernel fuses both reductions into a single memory pass; the
+    NumPy fallback streams the buffer twice but still never allocates.
+    """
+    if njit is not None:
+        return _minmax_f32(waveform)
+    return float(waveform.min()), float(waveform.max())
+
+
+def _resample_to_16k(waveform: np.ndarray, orig_sr: int) -> np.ndarray:
+    """
+    Resample a mono float32 waveform to 16kHz.
+
+    Uses soxr's SIMD polyphase resampler when the package is installed;
+    falls back to linear interpolation, which is adequate for speech.
+    """
+    try:
+        import soxr
+        return soxr.resample(waveform, orig_sr, _SAMPLE_RATE)
+    except ImportError:
+        pass
+    # Fractional-index gather-lerp in float32 end to end: np.interp would
+    # promote both coordinate grids and the result to float64, tripling the
+    # memory traffic just to cast back down afterwards.
+    wf = np.ascontiguousarray(waveform, dtype=np.float32)
+    new_len = max(1, int(round(wf.shape[0] * _SAMPLE_RATE / orig_sr)))
+    if wf.shape[0] < 2:
+        return np.full(new_len, wf[0] if wf.shape[0] else 0.0, dtype=np.float32)
+    idx = np.arange(new_len, dtype=np.float32) * np.float32(orig_sr / _SAMPLE_RATE)
+    i0 = idx.astype(np.int32)
+    np.minimum(i0, wf.shape[0] - 2, out=i0)
+    frac = idx - i0.astype(np.float32)
+    base = wf[i0]
+    return base + (wf[i0 + 1] - base) * frac
+
+
+@functools.lru_cache(maxsize=1)
+def _is_cuda_available() -> bool:
+    """Probe CUDA once per process; the torch import and device query are slow."""
+    try:
+        import torch
+        return torch.cuda.is_available()
+    except ImportError:
+        return False
 
 
 class WhisperSTT:
@@ -18,6 +157,8 @@ class WhisperSTT:
         model_name: str = "base",
         device: str = "auto",
         compute_type: str = "auto",
+        cpu_threads: Optional[int] = None,
+        num_workers: int = 2,
     ):
         """
         Initialize the Whisper model.
@@ -25,29 +166,60 @@ class WhisperSTT:
         Args:
             model_name: e.g., 'tiny', 'base', 'small', 'medium', 'large-v3'
             device: 'cpu', 'cuda', or 'auto' (default: auto-detect)
-            compute_type: 'int8', 'float16', 'float32', or 'auto'
+            compute_type: 'int8', 'int8_float16', 'float16', 'float32', or 'auto'
+                (default: int8-quantized weights, which roughly halve model
+                memory and speed up decoding with negligible accuracy loss)
+            cpu_threads: CTranslate2 threads per CPU inference
+                (default: physical-core count; the library default of 4
+                under-uses larger CPUs)
+            num_workers: CTranslate2 worker pool size. With >1, concurrent
+                transcribe calls from different threads run truly in parallel.
         """
         if device == "auto":
-            device = "cuda" if self._is_cuda_available() else "cpu"
+            device = "cuda" if _is_cuda_available() else "cpu"
         if compute_type == "auto":
-            compute_type = "float16" if device == "cuda" else "float32"
+            compute_type = self._default_compute_type(device)
+        if cpu_threads is None:
+            cpu_threads = _default_cpu_threads()
 
-        self.model = WhisperModel(
-            model_name,
-            device=device,
-            compute_type=compute_type,
-        )
+        try:
+            self.model = _load_model(
+                model_name, device, compute_type, cpu_threads, num_workers
+            )
+        except ValueError:
+            # Backend rejected the quantized type; fall back to full precision
+            compute_type = "float16" if device == "cuda" else "float32"
+            self.model = _load_model(
+                model_name, device, compute_type, cpu_threads, num_workers
+            )
         self.model_name = model_name
         self.device = device
         self.compute_type = compute_type
+        # Bound once so per-call dispatch skips the attribute chain lookup
+        self._transcribe_fn = self.model.transcribe
+        # Built lazily on the first long-form input; short clips never pay for it
+        self._batched_pipeline = None
+
+    def _get_batched_pipeline(self):
+        """Lazily build the batched pipeline used for long-form audio."""
+        if self._batched_pipeline is None and BatchedInferencePipeline is not None:
+            self._batched_pipeline = BatchedInferencePipeline(model=self.model)
+        return self._batched_pipeline
 
     @staticmethod
-    def _is_cuda_available() -> bool:
+    def _default_compute_type(device: str) -> str:
+        """Resolve the int8-quantized default compute type for a device."""
+        if device != "cuda":
+            return "int8"
         try:
             import torch
-            return torch.cuda.is_available()
-        except ImportError:
-            return False
+            # Tensor Cores (compute capability >= 7) make the float16 half of
+            # int8_float16 worthwhile; older GPUs run plain int8 faster.
+            if torch.cuda.get_device_capability()[0] >= 7:
+                return "int8_float16"
+        except Exception:
+            pass
+        return "int8"
 
     def transcribe(
         self,
@@ -56,6 +228,9 @@ class WhisperSTT:
         task: Literal["transcribe", "translate"] = "transcribe",
         vad_filter: bool = True,
         beam_size: int = 5,
+        condition_on_previous_text: bool = False,
+        word_timestamps: bool = False,
+        sample_rate: Optional[int] = None,
         return_meta: bool = False,
     ) -> Union[str, Dict[str, Any]]:
         """
@@ -70,98 +245,185 @@ class WhisperSTT:
             task: 'transcribe' or 'translate' (to English).
             vad_filter: Skip silent parts (improves accuracy & speed).
             beam_size: Beam size for decoding (default: 5, higher = more accurate but slower).
+            condition_on_previous_text: Feed each 30s window the previous
+                window's output. Off by default: it keeps decoder context
+                bounded per window and lets chunks decode in parallel; True
+                can improve quality on long monologues but serializes chunks.
+            word_timestamps: Compute per-word timings (adds "words" to each
+                segment when return_meta=True). Off by default: the alignment
+                pass costs roughly 1.3-1.5x extra decode time.
+            sample_rate: Actual sample rate of an ndarray input. Non-16kHz
+                audio is resampled before decoding instead of producing
+                garbage; if None, the array is assumed to already be 16kHz.
             return_meta: If True, return dict with segments, language, etc.
 
         Returns:
             str or dict with transcription and optional metadata.
         """
-        temp_file_path = None
-        try:
-            if isinstance(audio_input, (str, Path)):
-                # Pass file path directly
-                audio_path = Path(audio_input)
-                if not audio_path.exists():
-                    raise FileNotFoundError(f"Audio file not found: {audio_input}")
-                audio = str(audio_input)
-            elif isinstance(audio_input, bytes):
-                # Write bytes to a temporary file (required by faster-whisper)
-                import tempfile
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
-                    tmp.write(audio_input)
-                    temp_file_path = tmp.name
-                audio = temp_file_path
-            elif isinstance(audio_input, np.ndarray):
-                # Accept numpy array, but warn about strict requirements
-                if audio_input.ndim != 1:
-                    raise ValueError("Audio array must be 1D (mono).")
-                if audio_input.dtype != np.float32:
+        if isinstance(audio_input, (str, Path)):
+            # Pass file path directly; faster-whisper opens the file itself,
+            # so a pre-flight exists() would just add a stat syscall per call
+            audio = str(audio_input)
+        elif isinstance(audio_input, bytes):
+            # Decode in memory; skips the temp-file write/read round trip
+            audio = decode_audio(io.BytesIO(audio_input), sampling_rate=_SAMPLE_RATE)
+        elif isinstance(audio_input, np.ndarray):
+            global _WARNED_DTYPE, _WARNED_16K
+            # Accept numpy array, but warn about strict requirements
+            if audio_input.ndim == 2:
+                # Stereo: mean-reduce the channel axis to mono in one
+                # vectorized pass instead of forcing a file round trip
+                axis = 0 if audio_input.shape[0] < audio_input.shape[1] else 1
+                audio_input = audio_input.mean(axis=axis, dtype=np.float32)
+            if audio_input.ndim != 1:
+                raise ValueError("Audio array must be 1D (mono).")
+            if audio_input.dtype != np.float32:
+                if not _WARNED_DTYPE:
                     warnings.warn("Converting audio array to float32.")
-                    audio_input = audio_input.astype(np.float32)
-                # Validate that audio is in the expected range
-                if np.abs(audio_input).max() > 1.0:
-                    warnings.warn(
-                        "Audio array values exceed [-1.0, 1.0] range. "
-                        "This may cause poor transcription quality. "
-                        "Consider normalizing your audio data."
-                    )
-                # Note: We cannot validate the sample rate from the array itself
-                # The caller must ensure it's 16kHz mono
+                    _WARNED_DTYPE = True
+            # Guarantee contiguous aligned float32 at the boundary: a no-op
+            # for conforming arrays, and one explicit copy otherwise instead
+            # of a hidden full-buffer copy inside CTranslate2
+            audio_input = np.require(
+                audio_input, dtype=np.float32, requirements=["C", "A"]
+            )
+            # Validate that audio is in the expected range; the fused min/max
+            # avoids materializing the full-size |x| temporary that np.abs makes
+            lo, hi = _amplitude_bounds(audio_input)
+            if hi > 1.0 or lo < -1.0:
+                warnings.warn(
+                    "Audio array values exceed [-1.0, 1.0] range. "
+                    "This may cause poor transcription quality. "
+                    "Consider normalizing your audio data."
+                )
+            if sample_rate is not None:
+                if sample_rate != _SAMPLE_RATE:
+                    # Wrong-rate audio decodes to garbage; resample up front
+                    # rather than waste the whole decode
+                    audio_input = _resample_to_16k(audio_input, sample_rate)
+            elif not _WARNED_16K:
+                # We cannot validate the sample rate from the array itself;
+                # without an explicit sample_rate the caller must ensure 16kHz
                 warnings.warn(
                     "Ensure your numpy array is sampled at 16kHz. "
                     "Incorrect sample rates will result in poor transcription."
                 )
-                # faster-whisper expects [-1.0, 1.0] float32 mono at 16kHz
-                audio = audio_input
-            else:
-                raise TypeError(
-                    "audio_input must be str, Path, bytes, or np.ndarray (1D, float32, 16kHz mono)."
-                )
+                _WARNED_16K = True
+            # faster-whisper expects [-1.0, 1.0] float32 mono at 16kHz
+            audio = audio_input
+        else:
+            raise TypeError(
+                "audio_input must be str, Path, bytes, or np.ndarray (1D, float32, 16kHz mono)."
+            )
 
-            # Run transcription
-            try:
-                segments, info = self.model.transcribe(
-                    audio,
-                    language=language,
-                    task=task,
-                    vad_filter=vad_filter,
-                    beam_size=beam_size,
-                )
-            except Exception as e:
-                raise RuntimeError(f"Transcription failed: {str(e)}") from e
-
-            # Collect results
-            segment_texts = []
-            segments_list = []
-            for segment in segments:
-                text = segment.text.strip()
-                segment_texts.append(text)
-                if return_meta:
-                    segments_list.append({
-                        "start": segment.start,
-                        "end": segment.end,
-                        "text": text,
-                    })
-
-            full_text = " ".join(segment_texts).strip()
-
-            if not return_meta:
-                return full_text
-
-            return {
-                "text": full_text,
-                "language": info.language,
-                "language_probability": info.language_probability,
-                "duration_seconds": info.duration,
-                "model_used": self.model_name,
-                "segments": segments_list,
-            }
-
-        finally:
-            # Ensure temporary file is cleaned up
-            if temp_file_path and os.path.exists(temp_file_path):
-                try:
-                    os.unlink(temp_file_path)
-                except OSError:
-                    # Best-effort cleanup; ignore if file is already gone
-                    pass
+        # Long-form audio: decode chunks in parallel batches; segments are
+        # merged across chunk boundaries inside the pipeline.
+        transcribe_fn = self._transcribe_fn
+        if (
+            isinstance(audio, np.ndarray)
+            and audio.shape[0] > _LONG_FORM_SECONDS * _SAMPLE_RATE
+        ):
+            pipeline = self._get_batched_pipeline()
+            if pipeline is not None:
+                transcribe_fn = pipeline.transcribe
+
+        # Run transcription
+        try:
+            segments, info = transcribe_fn(
+                audio,
+                language=language,
+                task=task,
+                vad_filter=vad_filter,
+                beam_size=beam_size,
+                condition_on_previous_text=condition_on_previous_text,
+                word_timestamps=word_timestamps,
+            )
+        except Exception as e:
+            # Missing files surface here as decoder open errors; keep raising
+            # the same FileNotFoundError callers have always seen
+            if isinstance(audio, str) and not os.path.exists(audio):
+                raise FileNotFoundError(
+                    f"Audio file not found: {audio_input}"
+                ) from e
+            raise RuntimeError(f"Transcription failed: {str(e)}") from e
+
+        # Collect results; the plain-text path skips all per-segment dict work
+        if not return_meta:
+            return " ".join(segment.text.strip() for segment in segments).strip()
+
+        if word_timestamps:
+            segments_list = [
+                {
+                    "start": segment.start,
+                    "end": segment.end,
+                    "text": segment.text.strip(),
+                    "words": [
+                        {"start": word.start, "end": word.end, "word": word.word}
+                        for word in (segment.words or ())
+                    ],
+                }
+                for segment in segments
+            ]
+        else:
+            # segment.words is None without alignment; never touch it here
+            segments_list = [
+                {
+                    "start": segment.start,
+                    "end": segment.end,
+                    "text": segment.text.strip(),
+                }
+                for segment in segments
+            ]
+        full_text = " ".join(seg["text"] for seg in segments_list).strip()
+
+        return {
+            "text": full_text,
+            "language": info.language,
+            "language_probability": info.language_probability,
+            "duration_seconds": info.duration,
+            "model_used": self.model_name,
+            "segments": segments_list,
+        }
+
+    def transcribe_fast(self, audio_input: Union[str, np.ndarray]) -> str:
+        """
+        Hot-path variant of transcribe(): default options, plain text out.
+
+        Skips input validation, the long-form pipeline check, and all
+        metadata plumbing. The caller must pass a file path or a 16kHz mono
+        float32 waveform in [-1.0, 1.0].
+        """
+        segments, _ = self._transcribe_fn(
+            audio_input,
+            vad_filter=True,
+            beam_size=5,
+            condition_on_previous_text=False,
+        )
+        return " ".join(segment.text.strip() for segment in segments).strip()
+
+    def transcribe_many(
+        self,
+        inputs: Iterable[Union[str, Path, bytes, np.ndarray]],
+        max_workers: int = 4,
+        **kwargs: Any,
+    ) -> List[Union[str, Dict[str, Any]]]:
+        """
+        Transcribe several inputs concurrently over the already-loaded model.
+
+        CTranslate2 releases the GIL during inference, so a thread pool gives
+        real parallelism on one model — provided it was built with
+        num_workers >= max_workers so its internal worker pool can serve the
+        threads without queueing.
+
+        Args:
+            inputs: Audio inputs in any form transcribe() accepts.
+            max_workers: Thread pool size for concurrent decode.
+            **kwargs: Forwarded to transcribe() for every input.
+
+        Returns:
+            Transcription results in input order.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda a: self.transcribe(a, **kwargs), inputs))
 
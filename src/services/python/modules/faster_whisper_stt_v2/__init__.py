@@ -10,4 +10,5 @@ Public entrypoints most users want:
 
 from .service import STTService  # noqa: F401
 from .registry import WhisperModelRegistry  # noqa: F401
+from .batching import DynamicBatcher, WavDecodeBatcher  # noqa: F401
 
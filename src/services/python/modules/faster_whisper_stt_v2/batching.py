@@ -0,0 +1,252 @@
+"""
+Request-level dynamic batching for the async STT service.
+
+Concurrent /transcribe requests are queued and drained by a background task
+that groups them by model key and audio-length bucket, then dispatches each
+group in one event-loop turn. Grouping keeps one model hot per batch instead
+of interleaving loads, and length buckets minimize padding waste when the
+underlying pipeline batches segments on the GPU.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from fastapi.concurrency import run_in_threadpool
+
+from .audio_io import _decode_wav_bytes_to_array, decode_wav_bytes_batch
+from .service import STTService
+from .types import AudioInput, TranscribeOptions
+
+# Length buckets (upper bound in seconds) used to group requests so that
+# short voice commands are not padded out to long-form clip lengths.
+_DURATION_BUCKETS_S = (10.0, 30.0)
+
+
+def _bucket_for(duration_seconds: float) -> int:
+    for i, upper in enumerate(_DURATION_BUCKETS_S):
+        if duration_seconds < upper:
+            return i
+    return len(_DURATION_BUCKETS_S)
+
+
+@dataclasses.dataclass
+class _PendingRequest:
+    model_name: str
+    device: str
+    compute_type: str
+    audio_input: AudioInput
+    options: Optional[TranscribeOptions]
+    future: "asyncio.Future[Union[str, Dict[str, Any]]]"
+
+    @property
+    def group_key(self) -> Tuple[str, str, str, int]:
+        duration = 0.0
+        if self.options and isinstance(self.options.get("duration_seconds"), (int, float)):
+            duration = float(self.options["duration_seconds"])
+        return (
+            self.model_name,
+            self.device,
+            self.compute_type,
+            _bucket_for(duration),
+        )
+
+
+class DynamicBatcher:
+    """
+    Coalesces concurrent transcription requests into grouped dispatches.
+
+    Requests are answered through per-request futures, so callers simply
+    ``await submit(...)`` and are unaware of the batching underneath.
+    """
+
+    def __init__(
+        self,
+        service: STTService,
+        *,
+        max_batch: int = 8,
+        max_wait_ms: float = 50.0,
+    ):
+        self.service = service
+        self.max_batch = max_batch
+        self.max_wait_ms = max_wait_ms
+        self._queue: "asyncio.Queue[_PendingRequest]" = asyncio.Queue()
+        self._drain_task: Optional[asyncio.Task] = None
+        # Group-dispatch tasks still running; referenced here so they are not
+        # garbage-collected mid-flight and can be awaited on stop()
+        self._inflight: set = set()
+
+    def start(self) -> None:
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.get_running_loop().create_task(self._drain())
+
+    async def stop(self) -> None:
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            try:
+                await self._drain_task
+            except asyncio.CancelledError:
+                pass
+            self._drain_task = None
+        if self._inflight:
+            # Let already-dispatched groups answer their callers
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    @property
+    def is_running(self) -> bool:
+        return self._drain_task is not None and not self._drain_task.done()
+
+    async def submit(
+        self,
+        *,
+        model_name: str = "base",
+        device: str = "auto",
+        compute_type: str = "auto",
+        audio_input: AudioInput,
+        options: Optional[TranscribeOptions] = None,
+    ) -> Union[str, Dict[str, Any]]:
+        if not self.is_running:
+            # Batcher not started (e.g. direct service usage in scripts/tests)
+            return await self.service.transcribe_async(
+                model_name=model_name,
+                device=device,
+                compute_type=compute_type,
+                audio_input=audio_input,
+                options=options,
+            )
+        request = _PendingRequest(
+            model_name=model_name,
+            device=device,
+            compute_type=compute_type,
+            audio_input=audio_input,
+            options=options,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        await self._queue.put(request)
+        return await request.future
+
+    async def _collect_batch(self) -> List[_PendingRequest]:
+        first = await self._queue.get()
+        batch = [first]
+        deadline = asyncio.get_running_loop().time() + self.max_wait_ms / 1000.0
+        while len(batch) < self.max_batch:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _dispatch_one(self, request: _PendingRequest) -> None:
+        try:
+            result = await self.service.transcribe_async(
+                model_name=request.model_name,
+                device=request.device,
+                compute_type=request.compute_type,
+                audio_input=request.audio_input,
+                options=request.options,
+            )
+        except Exception as e:  # propagate to the waiting caller, keep draining
+            if not request.future.done():
+                request.future.set_exception(e)
+            return
+        if not request.future.done():
+            request.future.set_result(result)
+
+    async def _dispatch_group(self, group: List[_PendingRequest]) -> None:
+        await asyncio.gather(*(self._dispatch_one(request) for request in group))
+
+    async def _drain(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect_batch()
+            groups: Dict[Tuple[str, str, str, int], List[_PendingRequest]] = {}
+            for request in batch:
+                groups.setdefault(request.group_key, []).append(request)
+            # Spawn each group as its own task and go straight back to
+            # collecting: grouping decides what gets dispatched together, the
+            # per-model semaphores bound actual concurrency. Awaiting a group
+            # inline here would serialize the whole server behind whichever
+            # batch happens to be running (head-of-line blocking).
+            for group in groups.values():
+                task = loop.create_task(self._dispatch_group(group))
+                self._inflight.add(task)
+                task.add_done_callback(self._inflight.discard)
+
+
+class WavDecodeBatcher:
+    """
+    Coalesces concurrent WAV-byte decodes into one vectorized threadpool call.
+
+    Payloads pending within a few milliseconds of each other are decoded
+    together by decode_wav_bytes_batch, so clips with identical sample rate
+    and length share a single batched resample pass instead of running the
+    kernel once per request. Callers ``await decode(...)`` and are unaware of
+    the batching underneath.
+    """
+
+    def __init__(self, *, max_batch: int = 16, max_wait_ms: float = 3.0):
+        self.max_batch = max_batch
+        self.max_wait_ms = max_wait_ms
+        self._queue: "asyncio.Queue[Tuple[bytes, asyncio.Future]]" = asyncio.Queue()
+        self._drain_task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.get_running_loop().create_task(self._drain())
+
+    async def stop(self) -> None:
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            try:
+                await self._drain_task
+            except asyncio.CancelledError:
+                pass
+            self._drain_task = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._drain_task is not None and not self._drain_task.done()
+
+    async def decode(self, payload: bytes) -> np.ndarray:
+        if not self.is_running:
+            # Batcher not started (e.g. direct usage in scripts/tests)
+            return await run_in_threadpool(_decode_wav_bytes_to_array, payload)
+        future: "asyncio.Future[np.ndarray]" = asyncio.get_running_loop().create_future()
+        await self._queue.put((payload, future))
+        return await future
+
+    async def _collect_batch(self) -> List[Tuple[bytes, asyncio.Future]]:
+        first = await self._queue.get()
+        batch = [first]
+        deadline = asyncio.get_running_loop().time() + self.max_wait_ms / 1000.0
+        while len(batch) < self.max_batch:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _drain(self) -> None:
+        while True:
+            batch = await self._collect_batch()
+            payloads = [payload for payload, _future in batch]
+            try:
+                results = await run_in_threadpool(decode_wav_bytes_batch, payloads)
+            except Exception as e:  # defensive; per-payload errors come back inline
+                results = [e] * len(batch)
+            for (_payload, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
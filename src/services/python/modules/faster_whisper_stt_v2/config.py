@@ -26,6 +26,7 @@ COMPUTE_MULTIPLIER: Dict[str, float] = {
     "float32": 2.0,
     "float16": 1.0,
     "int8": 0.6,
+    "int8_float16": 0.6,
 }
 
 # Transient per-inference base footprint per minute of audio (GB) by model.
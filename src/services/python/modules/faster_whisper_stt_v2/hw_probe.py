@@ -1,45 +1,66 @@
 """
 Hardware probing utilities and auto-resolution helpers.
+
+Probes run on every request via ResourceManager, so the expensive parts are
+amortized here: the optional backends (torch/pynvml/psutil) are imported once
+at module load, NVML is initialized once and its device handle reused, and
+the memory probes are cached behind a short TTL so bursts of concurrent
+requests share one reading.
 """
 
 from __future__ import annotations
 
+import functools
+import time
 from typing import Optional, Tuple
 
+try:
+    import torch  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    torch = None  # type: ignore
+
+try:
+    import pynvml  # type: ignore
+
+    pynvml.nvmlInit()
+    _NVML_HANDLE = pynvml.nvmlDeviceGetHandleByIndex(0)
+except Exception:  # pragma: no cover - optional dependency / no GPU
+    pynvml = None  # type: ignore
+    _NVML_HANDLE = None
+
+try:
+    import psutil  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    psutil = None  # type: ignore
+
+
+# Memory readings older than this are refreshed; within the window, bursts of
+# concurrent requests share one NVML/psutil call.
+_PROBE_TTL_SECONDS = 0.25
+
+_GPU_MEM_CACHE: Optional[Tuple[Optional[Tuple[float, float]], float]] = None
+_RAM_CACHE: Optional[Tuple[Optional[Tuple[float, float]], float]] = None
+
 
 def is_cuda_available() -> bool:
     try:
-        import torch  # type: ignore
-
-        return torch.cuda.is_available()
+        return torch is not None and torch.cuda.is_available()
     except Exception:
         return False
 
 
-def gpu_memory_gb() -> Optional[Tuple[float, float]]:
-    """
-    Returns (total_gb, free_gb) for the first visible GPU if available.
-    Falls back to torch if pynvml is not installed.
-    """
-    # Try pynvml for accurate readings
-    try:
-        import pynvml  # type: ignore
-
-        pynvml.nvmlInit()
-        handle = pynvml.nvmlDeviceGetHandleByIndex(0)
-        mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
-        total_gb = mem.total / (1024 ** 3)
-        free_gb = mem.free / (1024 ** 3)
-        pynvml.nvmlShutdown()
-        return total_gb, free_gb
-    except Exception:
-        pass
+def _gpu_memory_gb_uncached() -> Optional[Tuple[float, float]]:
+    # Prefer the persistent NVML handle for accurate readings
+    if _NVML_HANDLE is not None:
+        try:
+            mem = pynvml.nvmlDeviceGetMemoryInfo(_NVML_HANDLE)
+            return mem.total / (1024 ** 3), mem.free / (1024 ** 3)
+        except Exception:
+            pass
 
     # Fallback to torch if available
     try:
-        import torch  # type: ignore
-
-        if torch.cuda.is_available():
+        if torch is not None and torch.cuda.is_available():
             idx = torch.cuda.current_device()
             total = torch.cuda.get_device_properties(idx).total_memory
             # Rough free estimate: total - reserved
@@ -53,20 +74,44 @@ def gpu_memory_gb() -> Optional[Tuple[float, float]]:
     return None
 
 
+def gpu_memory_gb() -> Optional[Tuple[float, float]]:
+    """
+    Returns (total_gb, free_gb) for the first visible GPU if available.
+    Falls back to torch if pynvml is not installed. Readings are cached for
+    a short TTL since admission control probes on every request.
+    """
+    global _GPU_MEM_CACHE
+    now = time.monotonic()
+    if _GPU_MEM_CACHE is not None and now - _GPU_MEM_CACHE[1] <= _PROBE_TTL_SECONDS:
+        return _GPU_MEM_CACHE[0]
+    value = _gpu_memory_gb_uncached()
+    _GPU_MEM_CACHE = (value, now)
+    return value
+
+
 def ram_gb() -> Optional[Tuple[float, float]]:
     """
     Returns (total_gb, available_gb) of system RAM using psutil if available.
+    Cached for a short TTL like gpu_memory_gb.
     """
+    global _RAM_CACHE
+    now = time.monotonic()
+    if _RAM_CACHE is not None and now - _RAM_CACHE[1] <= _PROBE_TTL_SECONDS:
+        return _RAM_CACHE[0]
     try:
-        import psutil  # type: ignore
-
-        vm = psutil.virtual_memory()
-        return vm.total / (1024 ** 3), vm.available / (1024 ** 3)
+        if psutil is None:
+            value = None
+        else:
+            vm = psutil.virtual_memory()
+            value = (vm.total / (1024 ** 3), vm.available / (1024 ** 3))
     except Exception:
-        return None
+        value = None
+    _RAM_CACHE = (value, now)
+    return value
 
 
-def resolve_auto_device_compute(device: str, compute_type: str) -> Tuple[str, str]:
+@functools.lru_cache(maxsize=None)
+def _resolve_cached(device: str, compute_type: str) -> Tuple[str, str]:
     d = device
     if d == "auto":
         d = "cuda" if is_cuda_available() else "cpu"
@@ -75,3 +120,6 @@ def resolve_auto_device_compute(device: str, compute_type: str) -> Tuple[str, st
         c = "float16" if d == "cuda" else "float32"
     return d, c
 
+
+def resolve_auto_device_compute(device: str, compute_type: str) -> Tuple[str, str]:
+    return _resolve_cached(device, compute_type)
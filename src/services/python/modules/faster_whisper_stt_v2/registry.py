@@ -6,6 +6,7 @@ concurrency control.
 from __future__ import annotations
 
 import asyncio
+import os
 from typing import Dict, Optional, Tuple
 
 from faster_whisper import WhisperModel
@@ -19,18 +20,36 @@ class WhisperModelRegistry:
         self._models: Dict[ModelKey, WhisperModel] = {}
         self._locks: Dict[ModelKey, asyncio.Lock] = {}
         self._semaphores: Dict[ModelKey, asyncio.Semaphore] = {}
+        # Single lock guarding _locks/_semaphores mutation; per-key locks are
+        # created under it so the loaded-model fast path allocates nothing.
+        self._registry_lock = asyncio.Lock()
 
     @staticmethod
-    def _key(model_name: str, device: str, compute_type: str) -> ModelKey:
-        d, c = resolve_auto_device_compute(device, compute_type)
+    def _key(
+        model_name: str,
+        device: str,
+        compute_type: str,
+        resolved: Optional[Tuple[str, str]] = None,
+    ) -> ModelKey:
+        # Callers that already resolved "auto" (e.g. the service) pass the
+        # tuple through so the probe behind resolve_auto_device_compute is
+        # not repeated for every registry lookup.
+        d, c = resolved if resolved is not None else resolve_auto_device_compute(device, compute_type)
         if d not in ("cpu", "cuda"):
             d = "cpu"
-        if c not in ("float32", "float16", "int8"):
+        if c not in ("float32", "float16", "int8", "int8_float16"):
             c = "float32" if d == "cpu" else "float16"
         return ModelKey(model_name=model_name, device=d, compute_type=c)
 
-    def is_loaded(self, model_name: str, device: str, compute_type: str) -> bool:
-        key = self._key(model_name, device, compute_type)
+    def is_loaded(
+        self,
+        model_name: str,
+        device: str = "auto",
+        compute_type: str = "auto",
+        *,
+        resolved: Optional[Tuple[str, str]] = None,
+    ) -> bool:
+        key = self._key(model_name, device, compute_type, resolved)
         return key in self._models
 
     async def get_or_create(
@@ -40,21 +59,39 @@ class WhisperModelRegistry:
         compute_type: str = "auto",
         *,
         concurrency: Optional[int] = None,
+        resolved: Optional[Tuple[str, str]] = None,
     ) -> Tuple[ModelKey, WhisperModel]:
-        key = self._key(model_name, device, compute_type)
+        key = self._key(model_name, device, compute_type, resolved)
         if key in self._models:
             return key, self._models[key]
 
-        lock = self._locks.setdefault(key, asyncio.Lock())
+        lock = self._locks.get(key)
+        if lock is None:
+            async with self._registry_lock:
+                lock = self._locks.get(key)
+                if lock is None:
+                    lock = asyncio.Lock()
+                    self._locks[key] = lock
         async with lock:
             if key in self._models:
                 return key, self._models[key]
-            model = WhisperModel(key.model_name, device=key.device, compute_type=key.compute_type)
+            model = WhisperModel(
+                key.model_name,
+                device=key.device,
+                compute_type=key.compute_type,
+                # Optional shared cache (e.g. tmpfs) so repeated container
+                # starts mmap already-downloaded weights instead of refetching
+                download_root=os.environ.get("STT_DOWNLOAD_ROOT") or None,
+            )
             self._models[key] = model
             # default semaphore; may be overridden by service based on resources
             self._semaphores.setdefault(key, asyncio.Semaphore(concurrency or 1))
             return key, model
 
     def get_semaphore(self, key: ModelKey) -> asyncio.Semaphore:
-        return self._semaphores.setdefault(key, asyncio.Semaphore(1))
+        sem = self._semaphores.get(key)
+        if sem is None:
+            # Miss path only; setdefault would allocate a Semaphore per call
+            sem = self._semaphores.setdefault(key, asyncio.Semaphore(1))
+        return sem
 
@@ -87,11 +87,12 @@ class ResourceManager:
         audio_minutes: float,
         beam_size: int,
         is_loaded: bool,
+        snapshot: Optional[ResourceSnapshot] = None,
     ) -> Estimate:
         est = self.estimate(model_name, compute_type, audio_minutes, beam_size)
-        ok, reason = self.can_accept(device, est, is_loaded)
+        snap = snapshot or self.probe()
+        ok, reason = self.can_accept(device, est, is_loaded, snapshot=snap)
         if not ok:
-            snap = self.probe()
             raise ResourceRejectedError(reason or "Insufficient resources", snap)
         return est
 
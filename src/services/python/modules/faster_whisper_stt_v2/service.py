@@ -6,14 +6,29 @@ Suitable for FastAPI endpoints.
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, Optional, Union
+import wave
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
 
+import numpy as np
 from fastapi.concurrency import run_in_threadpool
 
+from .audio_io import _parse_wav_pcm_header
 from .resources import ResourceManager
 from .registry import WhisperModelRegistry
 from .transcription import transcribe_with_model
-from .types import AudioInput, ModelKey, ResourceRejectedError, TranscribeOptions
+from .types import AudioInput, ResourceRejectedError, TranscribeOptions
+
+# Baseline options merged under caller overrides; kept at module level so the
+# per-request merge is one dict display instead of a rebuilt literal + update.
+_DEFAULT_OPTIONS: TranscribeOptions = {
+    "language": None,
+    "task": "transcribe",
+    "vad_filter": True,
+    "beam_size": 5,
+    "return_meta": False,
+    "decode_wav_bytes": True,
+}
 
 
 class STTService:
@@ -21,10 +36,48 @@ class STTService:
         self.registry = registry or WhisperModelRegistry()
         self.resources = resources or ResourceManager()
 
+    async def warmup(self, specs: Iterable[Tuple[str, str, str]]) -> None:
+        """
+        Preload each (model_name, device, compute_type) spec and run one
+        second of silence through it, so weight loading and CTranslate2
+        kernel initialization happen at startup instead of on the first
+        user request. Best effort: a failing spec is skipped.
+        """
+        silence = np.zeros(16000, dtype=np.float32)
+        for model_name, device, compute_type in specs:
+            try:
+                resolved = self.resources.resolve(device, compute_type)
+                _key, model = await self.registry.get_or_create(
+                    model_name=model_name,
+                    resolved=resolved,
+                )
+                await run_in_threadpool(
+                    transcribe_with_model, model, silence, beam_size=1
+                )
+            except Exception:
+                continue
+
     @staticmethod
     def _estimate_audio_minutes(audio_input: AudioInput) -> float:
-        # Without decoding, use a conservative small default. You can replace this
-        # by inspecting headers or passing duration in options.
+        """
+        Cheap duration estimate for the admission controller: header-only for
+        WAV bytes and file paths, sample count for arrays. Falls back to a
+        conservative 1.0 minute when the input cannot be inspected.
+        """
+        try:
+            if isinstance(audio_input, np.ndarray):
+                return audio_input.size / 16000.0 / 60.0
+            if isinstance(audio_input, (bytes, bytearray)):
+                n_channels, sampwidth, framerate, _off, data_len = _parse_wav_pcm_header(
+                    bytes(audio_input)
+                )
+                n_frames = data_len // (sampwidth * n_channels)
+                return n_frames / framerate / 60.0
+            if isinstance(audio_input, (str, Path)):
+                with wave.open(str(audio_input), "rb") as wf:
+                    return wf.getnframes() / wf.getframerate() / 60.0
+        except Exception:
+            pass
         return 1.0
 
     async def transcribe_async(
@@ -36,22 +89,26 @@ class STTService:
         audio_input: AudioInput,
         options: Optional[TranscribeOptions] = None,
     ) -> Union[str, Dict[str, Any]]:
-        opts: TranscribeOptions = {
-            "language": None,
-            "task": "transcribe",
-            "vad_filter": True,
-            "beam_size": 5,
-            "return_meta": False,
-            "decode_wav_bytes": True,
-        }
-        if options:
-            opts.update(options)
+        opts: TranscribeOptions = {**_DEFAULT_OPTIONS, **(options or {})}
+        # Hoist the hot-path option reads into locals once instead of
+        # repeating opts.get() at each use site below.
+        language = opts["language"]
+        task = opts["task"]
+        vad_filter = bool(opts["vad_filter"])
+        beam_size = int(opts["beam_size"] or 5)
+        return_meta = bool(opts["return_meta"])
+        decode_wav_bytes = bool(opts["decode_wav_bytes"])
+        duration_seconds = opts.get("duration_seconds")
 
-        # Check resources and compute concurrency hint
-        resolved_device, resolved_compute = self.resources.resolve(device, compute_type)
-        is_loaded = self.registry.is_loaded(model_name, resolved_device, resolved_compute)
-        if isinstance(opts.get("duration_seconds"), (int, float)) and float(opts["duration_seconds"]) > 0:
-            audio_minutes = float(opts["duration_seconds"]) / 60.0
+        # Resolve "auto" and probe hardware once; both are threaded through
+        # the registry and admission checks below instead of re-running the
+        # device/NVML probes at each layer.
+        resolved = self.resources.resolve(device, compute_type)
+        resolved_device, resolved_compute = resolved
+        snapshot = self.resources.probe()
+        is_loaded = self.registry.is_loaded(model_name, resolved=resolved)
+        if isinstance(duration_seconds, (int, float)) and float(duration_seconds) > 0:
+            audio_minutes = float(duration_seconds) / 60.0
         else:
             audio_minutes = self._estimate_audio_minutes(audio_input)
         est = self.resources.admit_or_raise(
@@ -59,16 +116,16 @@ class STTService:
             model_name=model_name,
             compute_type=resolved_compute,
             audio_minutes=audio_minutes,
-            beam_size=int(opts.get("beam_size", 5) or 5),
+            beam_size=beam_size,
             is_loaded=is_loaded,
+            snapshot=snapshot,
         )
 
         # Get or create model and set per-model semaphore capacity
         key, model = await self.registry.get_or_create(
             model_name=model_name,
-            device=resolved_device,
-            compute_type=resolved_compute,
-            concurrency=max(1, self.resources.concurrency_hint(resolved_device, est)),
+            resolved=resolved,
+            concurrency=max(1, self.resources.concurrency_hint(resolved_device, est, snapshot=snapshot)),
         )
 
         sem = self.registry.get_semaphore(key)
@@ -77,10 +134,10 @@ class STTService:
                 transcribe_with_model,
                 model,
                 audio_input,
-                language=opts.get("language"),
-                task=opts.get("task", "transcribe"),
-                vad_filter=bool(opts.get("vad_filter", True)),
-                beam_size=int(opts.get("beam_size", 5) or 5),
-                return_meta=bool(opts.get("return_meta", False)),
-                decode_wav_bytes=bool(opts.get("decode_wav_bytes", True)),
+                language=language,
+                task=task,
+                vad_filter=vad_filter,
+                beam_size=beam_size,
+                return_meta=return_meta,
+                decode_wav_bytes=decode_wav_bytes,
             )
@@ -4,6 +4,7 @@ Pure transcription logic using a provided WhisperModel.
 
 from __future__ import annotations
 
+import io
 from typing import Any, Dict, List, Union
 
 import numpy as np
@@ -38,23 +39,24 @@ def transcribe_with_model(
         except Exception as e:
             raise RuntimeError(f"Transcription failed: {str(e)}") from e
 
-    # Collect results
-    segment_texts: List[str] = []
-    segments_list: List[Dict[str, Any]] = []
-    for segment in segments:
-        text = segment.text.strip()
-        segment_texts.append(text)
-        if return_meta:
-            segments_list.append(
-                {"start": segment.start, "end": segment.end, "text": text}
-            )
-
-    full_text = " ".join(segment_texts).strip()
+    # Collect results in bulk: exhaust the generator once, then build text and
+    # metadata with comprehensions (LIST_APPEND bytecode) instead of a Python
+    # for-loop appending per yield.
     if not return_meta:
-        return full_text
+        buf = io.StringIO()
+        write = buf.write
+        for segment in segments:
+            write(segment.text.strip())
+            write(" ")
+        return buf.getvalue().strip()
 
+    segs = list(segments)
+    texts = [s.text.strip() for s in segs]
+    segments_list: List[Dict[str, Any]] = [
+        {"start": s.start, "end": s.end, "text": t} for s, t in zip(segs, texts)
+    ]
     return {
-        "text": full_text,
+        "text": " ".join(texts).strip(),
         "language": getattr(info, "language", None),
         "language_probability": getattr(info, "language_probability", None),
         "duration_seconds": getattr(info, "duration", None),
@@ -11,7 +11,7 @@ import numpy as np
 
 
 DeviceLiteral = Literal["cpu", "cuda", "auto"]
-ComputeLiteral = Literal["float32", "float16", "int8", "auto"]
+ComputeLiteral = Literal["float32", "float16", "int8", "int8_float16", "auto"]
 TaskLiteral = Literal["transcribe", "translate"]
 
 
@@ -19,7 +19,7 @@ TaskLiteral = Literal["transcribe", "translate"]
 class ModelKey:
     model_name: str
     device: Literal["cpu", "cuda"]
-    compute_type: Literal["float32", "float16", "int8"]
+    compute_type: Literal["float32", "float16", "int8", "int8_float16"]
 
 
 class ResourceSnapshot(TypedDict, total=False):
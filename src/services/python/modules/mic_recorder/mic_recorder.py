@@ -9,17 +9,75 @@ except ImportError as e:
         "On Ubuntu/Debian: sudo apt-get install portaudio19-dev. "
         "On macOS: brew install portaudio."
     ) from e
+import array
+import atexit
+import sys
 import wave
 import threading
-from typing import Optional, Callable
+import queue
+import weakref
+from typing import Optional, Callable, Literal, Tuple
 import logging
-from collections import deque
 import io
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# PyAudio format -> sample dtype name, shared by the blocking backend
+# (sounddevice raw dtype) and the numpy sample views (np.dtype string)
+_SD_DTYPES = {
+    pyaudio.paInt16: "int16",
+    pyaudio.paInt32: "int32",
+    pyaudio.paInt8: "int8",
+    pyaudio.paFloat32: "float32",
+}
+
+# PyAudio format -> full-scale magnitude for dBFS level computation
+_FULL_SCALE = {
+    pyaudio.paInt16: 32768.0,
+    pyaudio.paInt32: 2147483648.0,
+    pyaudio.paInt8: 128.0,
+    pyaudio.paFloat32: 1.0,
+}
+
+# PyAudio format -> array.array typecode for endianness conversion
+_ARRAY_TYPECODES = {
+    pyaudio.paInt16: "h",
+    pyaudio.paInt32: "i",
+    pyaudio.paInt8: "b",
+    pyaudio.paFloat32: "f",
+}
+
+# Process-wide PyAudio instance: PortAudio init enumerates every device and
+# is the slow part of constructing a recorder, so it is paid once on first
+# use and torn down exactly once at interpreter exit.
+_PA_SINGLETON: Optional["pyaudio.PyAudio"] = None
+_PA_LOCK = threading.Lock()
+
+
+def _get_pa() -> "pyaudio.PyAudio":
+    global _PA_SINGLETON
+    with _PA_LOCK:
+        if _PA_SINGLETON is None:
+            _PA_SINGLETON = pyaudio.PyAudio()
+            atexit.register(_PA_SINGLETON.terminate)
+        return _PA_SINGLETON
+
+
+def _close_stream(stream) -> None:
+    """
+    weakref.finalize callback: close an open PyAudio stream.
+
+    Module-level on purpose — a finalize callback must not hold a reference
+    to the recorder, or the recorder would never be collected.
+    """
+    try:
+        stream.stop_stream()
+        stream.close()
+    except Exception:
+        pass
+
 
 class MicRecorder:
     def __init__(
@@ -29,6 +87,9 @@ class MicRecorder:
         format: int = pyaudio.paInt16, # pyright: ignore[reportUndefinedVariable]
         chunk: int = 1024,
         device_index: Optional[int] = None,
+        backend: str = "callback",
+        max_seconds: float = 300.0,
+        overflow: Literal["stop", "drop_oldest"] = "stop",
     ):
         """
         Initialize the microphone recorder.
@@ -39,29 +100,98 @@ class MicRecorder:
             format: Audio format (e.g., pyaudio.paInt16)
             chunk: Number of frames per buffer
             device_index: Specific input device index (None = default)
+            backend: Capture backend. "callback" (default) uses a Python
+                PortAudio callback. "rtmixer" records through rtmixer's
+                C ring buffer so no Python code runs on the real-time
+                audio thread (requires the rtmixer package). "blocking"
+                reads frames from a sounddevice RawInputStream on a normal
+                thread, so PortAudio blocks in C and no Python runs on the
+                audio thread at all (requires the sounddevice package).
+            max_seconds: Capacity of the pre-allocated capture buffer.
+            overflow: What happens when the buffer fills. "stop" (default)
+                ends the recording; "drop_oldest" wraps around and overwrites
+                the oldest audio, bounding memory for always-listening use.
         """
+        if backend not in ("callback", "rtmixer", "blocking"):
+            raise ValueError(f"Unknown backend: {backend!r}")
+        if overflow not in ("stop", "drop_oldest"):
+            raise ValueError(f"Unknown overflow policy: {overflow!r}")
         self.rate = rate
         self.channels = channels
         self.format = format
         self.chunk = chunk
         self.device_index = device_index
-        self.audio = pyaudio.PyAudio()
+        self.backend = backend
+        self.audio = _get_pa()
         self.stream = None
+        self._finalizer: Optional[weakref.finalize] = None
         self.is_recording = False
-        self.frames = deque()
-        self._frames_lock = threading.Lock()
+        # Pre-allocated capture buffer: the callback memcpys each chunk into
+        # the next memoryview slice instead of allocating a bytes object per
+        # chunk and paying an O(N) join at stop.
+        self._sample_size = self.audio.get_sample_size(format)
+        self._bytes_per_frame = channels * self._sample_size
+        self._bytes_per_sec = rate * self._bytes_per_frame
+        self._capacity_bytes = int(self._bytes_per_sec * max_seconds)
+        self._buf = bytearray(self._capacity_bytes)
+        self._mv = memoryview(self._buf)
+        self._write_pos = 0
+        self._overflow = overflow
+        self._overflow_count = 0
+        self._wrapped = False
+        self._device_cache: Optional[list] = None
+        self._mixer = None
+        self._ring_action = None
+        self._sd_stream = None
+        self._drain_thread: Optional[threading.Thread] = None
+        self._stop_evt = threading.Event()
+        # Streaming-save state: chunks flow through a queue to a disk-writer
+        # thread so producers never touch the file handle
+        self._wav: Optional[wave.Wave_write] = None
+        self._wav_fh = None
+        self._save_queue: Optional[queue.SimpleQueue] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        # Fixed-duration capture: the callback counts frames and signals
+        # completion at the exact sample boundary
+        self._target_frames: Optional[int] = None
+        self._captured_frames = 0
+        self._done_evt = threading.Event()
 
     def list_devices(self):
-        """List all available audio input devices."""
-        info = self.audio.get_host_api_info_by_index(0)
-        num_devices = info.get('deviceCount')
-        devices = []
-        for i in range(num_devices):
-            device = self.audio.get_device_info_by_host_api_device_index(0, i)
-            if device.get('maxInputChannels') > 0:
-                devices.append((i, device.get('name')))
-                logger.info(f"[Input Device] {i}: {device.get('name')}")
-        return devices
+        """
+        List all available audio input devices.
+
+        Enumeration crosses the PortAudio FFI for every device, so the result
+        is cached on the instance; call refresh_devices() after plugging or
+        unplugging hardware.
+        """
+        if self._device_cache is None:
+            info = self.audio.get_host_api_info_by_index(0)
+            num_devices = info.get('deviceCount')
+            devices = []
+            for i in range(num_devices):
+                device = self.audio.get_device_info_by_host_api_device_index(0, i)
+                if device.get('maxInputChannels') > 0:
+                    devices.append((i, device.get('name')))
+            self._device_cache = devices
+            self._log_devices()
+        return self._device_cache
+
+    def refresh_devices(self):
+        """Invalidate the device cache and re-enumerate."""
+        self._device_cache = None
+        return self.list_devices()
+
+    def _log_devices(self):
+        for i, name in self._device_cache or []:
+            logger.info(f"[Input Device] {i}: {name}")
+
+    def _get_device_info(self, index: int):
+        """Fetch one device's info; None if the index does not exist."""
+        try:
+            return self.audio.get_device_info_by_host_api_device_index(0, index)
+        except Exception:
+            return None
 
     def set_device(self, device: int | str) -> bool:
         """
@@ -78,9 +208,9 @@ class MicRecorder:
             ValueError: If device string is provided but no matching device is found.
         """
         if isinstance(device, int):
-            # Validate the device index exists
-            devices = self.list_devices()
-            if any(idx == device for idx, _ in devices):
+            # One targeted PortAudio call instead of a full enumeration
+            info = self._get_device_info(device)
+            if info is not None and info.get('maxInputChannels', 0) > 0:
                 self.device_index = device
                 logger.info(f"Device index set to {device}")
                 return True
@@ -88,13 +218,17 @@ class MicRecorder:
                 raise ValueError(f"Device index {device} not found in available devices")
 
         elif isinstance(device, str):
-            # Search for device by name (case-insensitive partial match)
+            # Search for device by name: O(1) exact match against a lowered
+            # name index, falling back to a case-insensitive substring scan
             devices = self.list_devices()
             device_lower = device.lower()
-            matching_device = next(
-                (idx for idx, name in devices if device_lower in name.lower()),
-                None
-            )
+            by_name = {name.lower(): idx for idx, name in devices}
+            matching_device = by_name.get(device_lower)
+            if matching_device is None:
+                matching_device = next(
+                    (idx for idx, name in devices if device_lower in name.lower()),
+                    None
+                )
 
             if matching_device is not None:
                 self.device_index = matching_device
@@ -108,33 +242,125 @@ class MicRecorder:
         else:
             raise TypeError(f"device must be int or str, got {type(device).__name__}")
 
-    def start_recording(self, callback: Optional[Callable[[bytes], None]] = None):
+    def start_recording(
+        self,
+        callback: Optional[Callable[[bytes], None]] = None,
+        save_to: Optional[str] = None,
+    ):
         """
         Start recording audio.
 
         Args:
             callback: Optional function to process each audio chunk in real time.
-                      If None, audio is stored in self.frames.
+                      If None, audio is stored in the capture buffer.
+            save_to: Optional WAV file path. When given, chunks stream to disk
+                     through a writer thread as they arrive (O(1) memory, no
+                     stop-time flush) instead of accumulating in the buffer.
         """
         if self.is_recording:
             logger.warning("Already recording!")
             return
+        if callback is not None and not callable(callback):
+            raise TypeError("callback must be callable")
+
+        if save_to:
+            self._open_streaming_wav(save_to)
+
+        if self.backend == "rtmixer":
+            self._start_rtmixer(callback)
+            return
+        if self.backend == "blocking":
+            self._start_blocking(callback)
+            return
 
+        # Specialize the callback: everything it touches is bound into the
+        # closure as a local, so each invocation is a memcpy plus a couple of
+        # LOAD_FAST ops — no self.* attribute lookups on the real-time
+        # thread. (A true nogil C callback needs the rtmixer backend; this is
+        # as lean as a Python callback gets.)
+        mv = self._mv
+        capacity = self._capacity_bytes
+        cont = (None, pyaudio.paContinue)
+        done = (None, pyaudio.paComplete)
+        # Captured once: a bool read per chunk instead of isEnabledFor's
+        # handler-chain walk, and %-style args so nothing is formatted
+        # unless debug logging is actually on
+        debug = logger.isEnabledFor(logging.DEBUG)
+        save_queue = self._save_queue
+        target_frames = self._target_frames
+        done_evt = self._done_evt
+        drop_oldest = self._overflow == "drop_oldest"
+        bytes_per_frame = self._bytes_per_frame
+
+        # No try/except in the callback: inputs are validated above (once,
+        # not per chunk), the bounds check below is a compare-and-branch, and
+        # PortAudio reports driver problems through the status argument
+        # rather than by raising. Exception-frame setup is pure overhead on
+        # the real-time thread, and the old handler silently killed the
+        # stream on any consumer bug.
         def audio_callback(in_data, frame_count, time_info, status):
-            try:
-                logger.debug(f"Audio callback received {len(in_data)} bytes")
+            if debug:
+                logger.debug("Audio callback received %d bytes", len(in_data))
+            finished = False
+            if target_frames is not None:
+                # Sample-accurate stop: truncate this chunk at the exact
+                # frame boundary before it is stored (mirrors
+                # _clip_to_target on the drain-loop backends), so all three
+                # backends return the same capture length for a duration
+                remaining = target_frames - self._captured_frames
+                if frame_count >= remaining:
+                    in_data = in_data[: remaining * bytes_per_frame]
+                    self._captured_frames = target_frames
+                    finished = True
+                else:
+                    self._captured_frames += frame_count
+            if save_queue is not None:
+                # Streaming save: hand the chunk to the disk-writer
+                # thread; the callback never touches the file handle.
+                # The user callback sees the same bytes object — one
+                # physical buffer per chunk, shared by refcount, never
+                # copied per consumer.
+                save_queue.put(in_data)
                 if callback:
                     callback(in_data)
+            elif callback:
+                callback(in_data)
+            else:
+                # SPSC: this callback is the sole writer of _write_pos,
+                # so the memcpy plus a single int store needs no lock —
+                # taking one here would put lock contention (and thus
+                # priority-inversion jitter) on the real-time thread.
+                pos = self._write_pos
+                end = pos + len(in_data)
+                if end > capacity:
+                    if not drop_oldest:
+                        logger.error("Capture buffer full; stopping stream.")
+                        return done
+                    # Ring wrap: overwrite the oldest audio (split copy
+                    # across the boundary); warn once per burst
+                    first = capacity - pos
+                    mv[pos:capacity] = in_data[:first]
+                    rest = len(in_data) - first
+                    mv[0:rest] = in_data[first:]
+                    self._write_pos = rest
+                    self._overflow_count += 1
+                    if not self._wrapped:
+                        self._wrapped = True
+                        logger.warning(
+                            "Capture buffer wrapped; oldest audio is being overwritten."
+                        )
                 else:
-                    with self._frames_lock:
-                        self.frames.append(in_data)
-                        logger.debug(f"Frames count: {len(self.frames)}")
-                return (None, pyaudio.paContinue)
-            except Exception as e:
-                logger.error(f"Error in audio callback: {e}")
-                return (None, pyaudio.paComplete)
+                    mv[pos:end] = in_data
+                    self._write_pos = end
+            if finished:
+                done_evt.set()
+                return done
+            return cont
 
         try:
+            # Reset before the stream opens so the callback never races the
+            # offset reset
+            self._reset_buffer()
             # Always use callback mode for proper audio capture
             self.stream = self.audio.open(
                 format=self.format,
@@ -145,40 +371,408 @@ class MicRecorder:
                 frames_per_buffer=self.chunk,
                 stream_callback=audio_callback,
             )
+            # Deterministic cleanup even if the recorder is dropped while
+            # recording; stop_recording() detaches and runs this itself.
+            self._finalizer = weakref.finalize(self, _close_stream, self.stream)
             self.is_recording = True
-            with self._frames_lock:
-                self.frames.clear()
             logger.info(f"Recording started with callback: {callback is not None}")
         except Exception as e:
             logger.error(f"Failed to start recording: {e}")
             raise
 
+    def _reset_buffer(self):
+        self._write_pos = 0
+        self._overflow_count = 0
+        self._wrapped = False
+
+    def _store_chunk(self, chunk: bytes) -> bool:
+        """
+        Append a chunk to the capture buffer from a drain thread.
+
+        Applies the same overflow policy as the RT callback: returns False to
+        stop capture when full under "stop", wraps (overwriting the oldest
+        audio) under "drop_oldest".
+        """
+        n = len(chunk)
+        pos = self._write_pos
+        end = pos + n
+        if end <= self._capacity_bytes:
+            self._mv[pos:end] = chunk
+            self._write_pos = end
+            return True
+        if self._overflow != "drop_oldest":
+            logger.error("Capture buffer full; discarding audio.")
+            return False
+        first = self._capacity_bytes - pos
+        self._mv[pos:] = chunk[:first]
+        rest = n - first
+        self._mv[0:rest] = chunk[first:]
+        self._write_pos = rest
+        self._overflow_count += 1
+        if not self._wrapped:
+            self._wrapped = True
+            logger.warning("Capture buffer wrapped; oldest audio is being overwritten.")
+        return True
+
+    def _clip_to_target(self, chunk: bytes) -> Tuple[bytes, bool]:
+        """
+        Truncate a drained chunk at the frame target, if one is set.
+
+        Mirrors the frame-count check the callback backend does inline, so
+        record_for_duration() stops at the exact sample boundary on the
+        rtmixer and blocking backends too instead of riding the wall-clock
+        safety timeout. Returns (possibly shortened chunk, done flag).
+        """
+        target = self._target_frames
+        if target is None:
+            return chunk, False
+        frames = len(chunk) // self._bytes_per_frame
+        remaining = target - self._captured_frames
+        if frames >= remaining:
+            self._captured_frames = target
+            self._done_evt.set()
+            return chunk[: remaining * self._bytes_per_frame], True
+        self._captured_frames += frames
+        return chunk, False
+
+    def _captured_bytes(self) -> bytes:
+        """Captured audio in arrival order, unrolling the ring if it wrapped."""
+        if not self._wrapped:
+            return bytes(self._mv[:self._write_pos])
+        pos = self._write_pos
+        return bytes(self._mv[pos:]) + bytes(self._mv[:pos])
+
+    def get_overflow_count(self) -> int:
+        """Number of chunks that wrapped the buffer (drop_oldest mode)."""
+        return self._overflow_count
+
+    def _open_streaming_wav(self, save_to: str):
+        """Open the WAV file and start the disk-writer thread for streaming save."""
+        # 1 MB buffered handle so per-chunk writeframesraw calls coalesce
+        # into large write() syscalls instead of one per ~4 KB chunk
+        self._wav_fh = open(save_to, "wb", buffering=1 << 20)
+        wf = wave.open(self._wav_fh, "wb")
+        wf.setnchannels(self.channels)
+        wf.setsampwidth(self._sample_size)
+        wf.setframerate(self.rate)
+        self._wav = wf
+        self._save_queue = queue.SimpleQueue()
+        self._writer_thread = threading.Thread(
+            target=self._wav_writer, daemon=True
+        )
+        self._writer_thread.start()
+
+    def _wav_writer(self):
+        """Disk-writer loop: writeframesraw per chunk, header patched on close."""
+        while True:
+            chunk = self._save_queue.get()
+            if chunk is None:
+                break
+            self._wav.writeframesraw(chunk)
+
+    def _finish_streaming_wav(self):
+        if self._save_queue is not None:
+            self._save_queue.put(None)
+        if self._writer_thread is not None:
+            self._writer_thread.join()
+            self._writer_thread = None
+        if self._wav is not None:
+            # close() patches the RIFF sizes exactly once; the buffered file
+            # handle is ours to close since wave was given an open object
+            self._wav.close()
+            self._wav = None
+        if self._wav_fh is not None:
+            self._wav_fh.close()
+            self._wav_fh = None
+        self._save_queue = None
+
+    def _start_rtmixer(self, callback: Optional[Callable[[bytes], None]]):
+        """
+        Start capture through rtmixer's PortAudio ring buffer.
+
+        The PortAudio callback is pure C code writing into the ring buffer;
+        Python only drains it from a normal (non-real-time) thread, so the
+        audio thread never touches the GIL and is immune to GC pauses. The
+        user callback, when given, is invoked from the drain thread.
+        """
+        try:
+            import rtmixer
+        except ImportError as e:
+            raise ImportError(
+                "The rtmixer backend requires the rtmixer package. "
+                "Install it using 'pip install rtmixer'."
+            ) from e
+
+        frame_bytes = self._bytes_per_frame
+        # Ring sized to hold several chunks; rtmixer requires a power of two
+        size = 1
+        while size < self.chunk * 16:
+            size *= 2
+
+        try:
+            ring = rtmixer.RingBuffer(frame_bytes, size)
+            self._mixer = rtmixer.Recorder(
+                samplerate=self.rate,
+                channels=self.channels,
+                blocksize=self.chunk,
+                device=self.device_index,
+            )
+            self._mixer.start()
+            self._ring_action = self._mixer.record_ringbuffer(ring)
+            self._stop_evt.clear()
+            self._reset_buffer()
+            self._drain_thread = threading.Thread(
+                target=self._drain_ringbuffer,
+                args=(ring, callback),
+                daemon=True,
+            )
+            self._drain_thread.start()
+            self.is_recording = True
+            logger.info(f"Recording started (rtmixer) with callback: {callback is not None}")
+        except Exception as e:
+            logger.error(f"Failed to start recording: {e}")
+            raise
+
+    def _start_blocking(self, callback: Optional[Callable[[bytes], None]]):
+        """
+        Start capture with sounddevice's blocking read API.
+
+        stream.read() blocks inside PortAudio's C code, so no Python ever
+        runs on the audio thread — the whole class of GIL/GC-induced xruns
+        disappears at the cost of one extra drain thread. latency='high' is
+        deliberate: capture-to-file is not latency-bound.
+        """
+        try:
+            import sounddevice as sd
+        except ImportError as e:
+            raise ImportError(
+                "The blocking backend requires the sounddevice package. "
+                "Install it using 'pip install sounddevice'."
+            ) from e
+
+        dtype = _SD_DTYPES.get(self.format)
+        if dtype is None:
+            raise ValueError(f"Unsupported format for blocking backend: {self.format}")
+
+        try:
+            stream = sd.RawInputStream(
+                samplerate=self.rate,
+                channels=self.channels,
+                dtype=dtype,
+                blocksize=self.chunk,
+                device=self.device_index,
+                latency="high",
+            )
+            stream.start()
+            self._sd_stream = stream
+            self._stop_evt.clear()
+            self._reset_buffer()
+            self._drain_thread = threading.Thread(
+                target=self._drain_blocking,
+                args=(stream, callback),
+                daemon=True,
+            )
+            self._drain_thread.start()
+            self.is_recording = True
+            logger.info(f"Recording started (blocking) with callback: {callback is not None}")
+        except Exception as e:
+            logger.error(f"Failed to start recording: {e}")
+            raise
+
+    def _drain_blocking(self, stream, callback: Optional[Callable[[bytes], None]]):
+        """Blocking-read loop; PortAudio blocks in C between chunks."""
+        while not self._stop_evt.is_set():
+            data, overflowed = stream.read(self.chunk)
+            if overflowed:
+                logger.warning("Input overflow detected.")
+            chunk, done = self._clip_to_target(bytes(data))
+            if self._save_queue is not None:
+                # Same object fanned out to both consumers (refcount-shared)
+                self._save_queue.put(chunk)
+                if callback:
+                    callback(chunk)
+            elif callback:
+                callback(chunk)
+            elif not self._store_chunk(chunk):
+                break
+            if done:
+                break
+
+    def _drain_ringbuffer(self, ring, callback: Optional[Callable[[bytes], None]]):
+        """Drain loop moving captured bytes off the C ring buffer."""
+        while True:
+            available = ring.read_available
+            if available:
+                data, _ = ring.read(available)
+                chunk, done = self._clip_to_target(bytes(data))
+                if self._save_queue is not None:
+                    self._save_queue.put(chunk)
+                    if callback:
+                        callback(chunk)
+                elif callback:
+                    callback(chunk)
+                # Sole producer in this mode; same lock-free SPSC contract
+                # as the callback path
+                elif not self._store_chunk(chunk):
+                    break
+                if done:
+                    break
+            elif self._stop_evt.is_set():
+                break
+            else:
+                self._stop_evt.wait(0.005)
+
     def stop_recording(self) -> bytes:
         """Stop recording and return raw audio data."""
         if not self.is_recording:
             logger.warning("Not currently recording.")
             return b""
 
-        if self.stream:
+        if self._mixer is not None:
+            if self._ring_action is not None:
+                try:
+                    self._mixer.cancel(self._ring_action)
+                except Exception:
+                    pass
+                self._ring_action = None
+            self._stop_evt.set()
+            if self._drain_thread is not None:
+                self._drain_thread.join()
+                self._drain_thread = None
+            self._mixer.stop()
+            self._mixer.close()
+            self._mixer = None
+        if self._sd_stream is not None:
+            self._stop_evt.set()
+            if self._drain_thread is not None:
+                self._drain_thread.join()
+                self._drain_thread = None
+            self._sd_stream.stop()
+            self._sd_stream.close()
+            self._sd_stream = None
+        if self._finalizer is not None:
+            # Runs _close_stream exactly once; a later GC of this recorder
+            # sees a dead finalizer and does nothing
+            self._finalizer()
+            self._finalizer = None
+            self.stream = None
+        elif self.stream:
             self.stream.stop_stream()
             self.stream.close()
         self.is_recording = False
         logger.info("Recording stopped.")
 
-        # Combine frames into raw bytes
-        with self._frames_lock:
-            audio_data = b"".join(self.frames) if self.frames else b""
-        return audio_data
+        if self._wav is not None:
+            # Streaming save: audio already sits on disk, nothing in RAM
+            self._finish_streaming_wav()
+            return b""
+
+        # stop_stream() above guarantees the callback is no longer running,
+        # so sampling the offset needs no synchronization
+        return self._captured_bytes()
+
+    def get_samples(self) -> np.ndarray:
+        """
+        Zero-copy NumPy view of the captured samples.
+
+        The array shares memory with the capture buffer (np.frombuffer, no
+        copy), so downstream processing — level metering, gain, endianness
+        flips via arr.byteswap(), resampling — runs as vectorized C instead
+        of Python byte iteration. Treat it as read-only while recording.
+        """
+        dtype = _SD_DTYPES.get(self.format)
+        if dtype is None:
+            raise ValueError(f"Unsupported sample format: {self.format}")
+        if self._wrapped:
+            # Unrolling the ring requires a copy; the common case stays
+            # zero-copy
+            return np.frombuffer(self._captured_bytes(), dtype=dtype)
+        return np.frombuffer(self._mv[:self._write_pos], dtype=dtype)
+
+    def get_level_db(self, window_ms: float = 50.0) -> float:
+        """
+        RMS level of the most recent window in dBFS, for live meters.
+
+        Vectorized over a zero-copy view of the capture buffer tail (a copy
+        only when the ring has wrapped), so polling this at UI rate costs
+        microseconds. Returns -120.0 when nothing has been captured yet.
+        """
+        full_scale = _FULL_SCALE.get(self.format)
+        if full_scale is None:
+            raise ValueError(f"Unsupported sample format: {self.format}")
+        n_frames = int(self.rate * window_ms / 1000.0)
+        samples = self.get_samples()
+        if samples.size == 0:
+            return -120.0
+        window = samples[-(n_frames * self.channels):]
+        rms = float(np.sqrt(np.mean(np.square(window, dtype=np.float64))))
+        if rms <= 0.0:
+            return -120.0
+        return float(20.0 * np.log10(rms / full_scale))
+
+    def apply_gain(self, multiplier: float) -> None:
+        """
+        Scale the captured samples in place, saturating at full scale.
+
+        One vectorized multiply+clip over the buffer view replaces any
+        per-sample Python loop — millions of samples per second via NumPy's
+        SIMD paths instead of tens of thousands. Call after stop_recording();
+        save_to_wav() then emits the amplified audio with no extra copy.
+        """
+        dtype = _SD_DTYPES.get(self.format)
+        if dtype is None:
+            raise ValueError(f"Unsupported sample format: {self.format}")
+        # memoryview over the bytearray is writable, so this view mutates the
+        # capture buffer directly. Once the drop_oldest ring has wrapped, the
+        # whole buffer is live audio ([write_pos:] holds the older half), so
+        # scale all of it — scaling only [:write_pos] would leave a gain
+        # discontinuity at the wrap point.
+        end = self._capacity_bytes if self._wrapped else self._write_pos
+        arr = np.frombuffer(self._mv[:end], dtype=dtype)
+        if arr.size == 0:
+            return
+        if self.format == pyaudio.paFloat32:
+            lo, hi = -1.0, 1.0
+            scaled = arr.astype(np.float64) * multiplier
+        else:
+            info = np.iinfo(arr.dtype)
+            lo, hi = info.min, info.max
+            scaled = arr.astype(np.int64) * multiplier
+        np.copyto(arr, np.clip(scaled, lo, hi).astype(arr.dtype))
+
+    def to_endianness(self, target: Literal["le", "be"]) -> array.array:
+        """
+        Captured samples with the requested byte order.
+
+        The swap, when needed, is a single arr.byteswap() — one C loop inside
+        CPython's arrayobject — instead of any per-sample Python shifting.
+        WAV is always little-endian, so consumers producing big-endian
+        payloads (e.g. AIFF, network protocols) call this with "be".
+        """
+        typecode = _ARRAY_TYPECODES.get(self.format)
+        if typecode is None:
+            raise ValueError(f"Unsupported sample format: {self.format}")
+        arr = array.array(typecode, self._captured_bytes())
+        if (sys.byteorder == "little") != (target == "le"):
+            arr.byteswap()
+        return arr
 
     def save_to_wav(self, filename: Optional[str] = None, audio_data: Optional[bytes] = None) -> Optional[bytes]:
         """Save recorded audio to a WAV file or return WAV bytes if no filename."""
-        with self._frames_lock:
-            data = audio_data or b"".join(self.frames)
+        if audio_data is not None:
+            data = audio_data
+        else:
+            # writeframes accepts any buffer-protocol object, so hand it the
+            # memoryview slice directly — no recording-sized bytes copy. A
+            # single int read of the write offset is atomic in CPython, so
+            # sampling it mid-recording needs no lock either. (A wrapped ring
+            # must be unrolled, which costs one copy.)
+            data = self._captured_bytes() if self._wrapped else self._mv[:self._write_pos]
 
         if filename:
             with wave.open(filename, "wb") as wf:
                 wf.setnchannels(self.channels)
-                wf.setsampwidth(self.audio.get_sample_size(self.format))
+                wf.setsampwidth(self._sample_size)
                 wf.setframerate(self.rate)
                 wf.writeframes(data)
             logger.info(f"Audio saved to {filename}")
@@ -187,7 +781,7 @@ class MicRecorder:
             buffer = io.BytesIO()
             with wave.open(buffer, "wb") as wf:
                 wf.setnchannels(self.channels)
-                wf.setsampwidth(self.audio.get_sample_size(self.format))
+                wf.setsampwidth(self._sample_size)
                 wf.setframerate(self.rate)
                 wf.writeframes(data)
             wav_bytes = buffer.getvalue()
@@ -195,25 +789,33 @@ class MicRecorder:
             return wav_bytes
 
     def record_for_duration(self, duration_sec: float, filename: Optional[str] = None) -> bytes:
-        """Convenience method to record for a fixed duration."""
-        import time
-        self.start_recording()
-        time.sleep(duration_sec)
-        audio = self.stop_recording()
+        """
+        Convenience method to record for a fixed duration.
+
+        Duration is enforced by counting frames in the callback rather than
+        sleeping: the recording stops at the exact sample boundary instead of
+        drifting with scheduler jitter. The wait timeout is only a safety net
+        in case the stream dies before reaching the target.
+        """
+        self._target_frames = int(duration_sec * self.rate)
+        self._captured_frames = 0
+        self._done_evt.clear()
+        try:
+            self.start_recording()
+            self._done_evt.wait(timeout=duration_sec + 0.5)
+            audio = self.stop_recording()
+        finally:
+            self._target_frames = None
         if filename:
             self.save_to_wav(filename, audio)
         return audio
 
-    def __del__(self):
-        """Clean up PyAudio on deletion."""
-        try:
-            logger.debug("Cleaning up MicRecorder resources")
-            if hasattr(self, 'stream') and self.stream:
-                self.stream.stop_stream()
-                self.stream.close()
-                logger.debug("Stream closed")
-            if hasattr(self, 'audio') and self.audio:
-                self.audio.terminate()
-                logger.debug("PyAudio terminated")
-        except Exception as e:
-            logger.error(f"Error during cleanup: {e}")
\ No newline at end of file
+    def __enter__(self) -> "MicRecorder":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        # No __del__: weakref.finalize covers dropped recorders without the
+        # interpreter-shutdown hazards, and the shared PyAudio singleton is
+        # terminated exactly once by its atexit handler.
+        if self.is_recording:
+            self.stop_recording()
\ No newline at end of file
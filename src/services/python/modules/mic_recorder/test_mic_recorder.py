@@ -2,18 +2,23 @@
 
 import unittest
 from unittest.mock import patch, MagicMock
+import numpy as np
+from modules.mic_recorder import mic_recorder
 from modules.mic_recorder.mic_recorder import MicRecorder
 import pyaudio
-from collections import deque
 
 
 class TestMicRecorder(unittest.TestCase):
 
     def setUp(self):
+        # Reset the shared PyAudio singleton so each test gets its own mock
+        mic_recorder._PA_SINGLETON = None
         # Mock PyAudio instance
         self.mock_pyaudio_instance = MagicMock()
         self.mock_stream = MagicMock()
         self.mock_pyaudio_instance.open.return_value = self.mock_stream
+        # Buffer sizing in __init__ needs a real sample size
+        self.mock_pyaudio_instance.get_sample_size.return_value = 2
 
         # Patch PyAudio globally in the module
         self.patcher = patch('modules.mic_recorder.mic_recorder.pyaudio.PyAudio', return_value=self.mock_pyaudio_instance)
@@ -21,6 +26,7 @@ class TestMicRecorder(unittest.TestCase):
 
     def tearDown(self):
         self.patcher.stop()
+        mic_recorder._PA_SINGLETON = None
 
     def test_init_defaults(self):
         """Test default initialization."""
@@ -31,7 +37,7 @@ class TestMicRecorder(unittest.TestCase):
         self.assertEqual(recorder.chunk, 1024)
         self.assertIsNone(recorder.device_index)
         self.assertFalse(recorder.is_recording)
-        self.assertEqual(recorder.frames, deque())
+        self.assertEqual(recorder._write_pos, 0)
         self.MockPyAudio.assert_called_once()
 
     def test_init_custom_args(self):
@@ -80,7 +86,7 @@ class TestMicRecorder(unittest.TestCase):
         # Stream doesn't need to be started explicitly in callback mode
         self.mock_stream.start_stream.assert_not_called()
         self.assertTrue(recorder.is_recording)
-        self.assertEqual(recorder.frames, deque())
+        self.assertEqual(recorder._write_pos, 0)
 
     def test_start_recording_with_callback(self):
         """Test starting recording with a callback (no explicit start_stream)."""
@@ -96,7 +102,8 @@ class TestMicRecorder(unittest.TestCase):
         recorder = MicRecorder()
         recorder.is_recording = True
         recorder.stream = self.mock_stream
-        recorder.frames = deque([b'data1', b'data2'])
+        recorder._mv[:10] = b'data1data2'
+        recorder._write_pos = 10
         result = recorder.stop_recording()
         self.mock_stream.stop_stream.assert_called_once()
         self.mock_stream.close.assert_called_once()
@@ -150,8 +157,7 @@ class TestMicRecorder(unittest.TestCase):
         self.assertEqual(result, b'fake_wav_data')
 
     @patch('modules.mic_recorder.mic_recorder.wave')
-    @patch('time.sleep')
-    def test_record_for_duration(self, mock_sleep, mock_wave):
+    def test_record_for_duration(self, mock_wave):
         """Test the convenience method for fixed-duration recording."""
         mock_wf = MagicMock()
         mock_wave.open.return_value.__enter__.return_value = mock_wf
@@ -159,19 +165,94 @@ class TestMicRecorder(unittest.TestCase):
         recorder = MicRecorder()
         recorder.start_recording = MagicMock()
         recorder.stop_recording = MagicMock(return_value=b'audio_data')
-        self.mock_pyaudio_instance.get_sample_size.return_value = 2
+        recorder._done_evt = MagicMock()
 
         result = recorder.record_for_duration(3.0, "test.wav")
         recorder.start_recording.assert_called_once()
-        mock_sleep.assert_called_once_with(3.0)
+        # Frame-count target set from duration; wait timeout is a safety net
+        recorder._done_evt.wait.assert_called_once_with(timeout=3.5)
         recorder.stop_recording.assert_called_once()
         self.assertEqual(result, b'audio_data')
+        self.assertIsNone(recorder._target_frames)
+
+    def test_apply_gain_scales_in_place(self):
+        """Test that apply_gain scales the captured samples in the buffer."""
+        recorder = MicRecorder()
+        data = np.array([1000, -2000, 3000], dtype=np.int16).tobytes()
+        recorder._mv[:len(data)] = data
+        recorder._write_pos = len(data)
+        recorder.apply_gain(2.0)
+        out = np.frombuffer(recorder._mv[:len(data)], dtype=np.int16)
+        self.assertEqual(out.tolist(), [2000, -4000, 6000])
+
+    def test_apply_gain_saturates_at_full_scale(self):
+        """Test that apply_gain clips instead of wrapping around."""
+        recorder = MicRecorder()
+        data = np.array([30000, -30000], dtype=np.int16).tobytes()
+        recorder._mv[:len(data)] = data
+        recorder._write_pos = len(data)
+        recorder.apply_gain(2.0)
+        out = np.frombuffer(recorder._mv[:len(data)], dtype=np.int16)
+        self.assertEqual(out.tolist(), [32767, -32768])
+
+    def test_apply_gain_covers_wrapped_ring(self):
+        """Test that gain reaches the older half of a wrapped ring."""
+        # Tiny buffer: 16000 Hz * 2 B * 0.001 s = 32 bytes (16 samples)
+        recorder = MicRecorder(rate=16000, max_seconds=0.001, overflow="drop_oldest")
+        full = np.full(recorder._capacity_bytes // 2, 1000, dtype=np.int16)
+        recorder._mv[:] = full.tobytes()
+        recorder._write_pos = 8
+        recorder._wrapped = True
+        recorder.apply_gain(2.0)
+        out = np.frombuffer(recorder._mv, dtype=np.int16)
+        # [write_pos:] holds live older audio and must be scaled too
+        self.assertTrue((out == 2000).all())
+
+    def test_get_level_db_empty_buffer(self):
+        """Test that an empty capture buffer reports the -120 dB floor."""
+        recorder = MicRecorder()
+        self.assertEqual(recorder.get_level_db(), -120.0)
 
-    def test_del_cleans_up(self):
-        """Test that __del__ terminates the PyAudio instance."""
+    def test_get_level_db_half_scale(self):
+        """Test the dBFS level of a constant half-scale signal (~-6 dB)."""
         recorder = MicRecorder()
-        recorder.__del__()
-        self.mock_pyaudio_instance.terminate.assert_called_once()
+        data = np.full(100, 16384, dtype=np.int16).tobytes()
+        recorder._mv[:len(data)] = data
+        recorder._write_pos = len(data)
+        self.assertAlmostEqual(recorder.get_level_db(), -6.02, places=1)
+
+    def test_to_endianness_swaps_per_sample(self):
+        """Test that "be" output reverses the bytes of each int16 sample."""
+        recorder = MicRecorder()
+        data = b'\x01\x02\x03\x04'
+        recorder._mv[:len(data)] = data
+        recorder._write_pos = len(data)
+        le = recorder.to_endianness("le").tobytes()
+        be = recorder.to_endianness("be").tobytes()
+        # Host capture is little-endian, so "le" is a passthrough and "be"
+        # swaps within each 2-byte sample
+        self.assertEqual(le, data)
+        self.assertEqual(be, b'\x02\x01\x04\x03')
+
+    def test_finalizer_closes_stream(self):
+        """Test that a dropped recorder's finalizer closes the stream."""
+        recorder = MicRecorder()
+        recorder.start_recording()
+        finalizer = recorder._finalizer
+        self.assertIsNotNone(finalizer)
+        del recorder
+        finalizer()
+        self.mock_stream.close.assert_called_once()
+        # PyAudio is process-wide; individual recorders must not terminate it
+        self.mock_pyaudio_instance.terminate.assert_not_called()
+
+    def test_context_manager_stops_recording(self):
+        """Test that exiting the context manager stops an active recording."""
+        with MicRecorder() as recorder:
+            recorder.start_recording()
+            self.assertTrue(recorder.is_recording)
+        self.assertFalse(recorder.is_recording)
+        self.mock_stream.close.assert_called_once()
 
 
 if __name__ == '__main__':